@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from epub_translate_cli.domain.errors import PartialBatchTranslationError
+from epub_translate_cli.domain.models import (
+    TranslationRequest,
+    TranslationResponse,
+    TranslationSettings,
+)
+from epub_translate_cli.domain.ports import (
+    BatchTranslatorPort,
+    TranslationCachePort,
+    TranslatorPort,
+)
+from epub_translate_cli.infrastructure.logging.logger_factory import create_logger
+
+logger = create_logger(__name__)
+
+# Part of every cache key. Bump it whenever prompt templates, response sanitisation or
+# the key layout change, so translations produced by the old pipeline stop matching.
+TRANSLATION_CACHE_VERSION = 2
+
+
+def translation_cache_key(settings: TranslationSettings, request: TranslationRequest) -> str:
+    """Return a stable fingerprint of everything that determines one translation's text.
+
+    The chapter context and prior translations themselves are left out, so identical
+    source text reuses its earlier translation wherever it appears; the settings that
+    shape that context are included, so changing them stops earlier entries matching.
+    The pipeline version keeps a persistent cache from serving output of older prompts
+    or sanitisers.
+    """
+    payload = json.dumps(
+        [
+            TRANSLATION_CACHE_VERSION,
+            settings.model,
+            settings.source_lang,
+            settings.target_lang,
+            settings.temperature,
+            settings.context_paragraphs,
+            settings.context_token_budget,
+            sorted(request.glossary_terms.items()),
+            request.text,
+        ],
+        ensure_ascii=False,
+    )
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachingTranslator(BatchTranslatorPort):
+    """Translator decorator that reuses cached translations for identical source text.
+
+    Only successful translations are cached; provider errors propagate unchanged so
+    retry handling in ChapterTranslator still applies.
+    """
+
+    translator: TranslatorPort
+    settings: TranslationSettings
+    cache: TranslationCachePort
+
+    def translate(self, request: TranslationRequest) -> TranslationResponse:
+        """Return cached translation when available, otherwise delegate and store it."""
+        key = translation_cache_key(self.settings, request)
+        cached = self.cache.get(key)
+        if cached is not None:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Translation cache hit | text_len=%s", len(request.text))
+            return TranslationResponse(translated_text=cached)
+
+        response = self.translator.translate(request)
+        self.cache.put(key, response.translated_text)
+        return response
+
+    def translate_batch(self, requests: Sequence[TranslationRequest]) -> list[TranslationResponse]:
+        """Serve cached paragraphs and translate only the misses, batching them when possible."""
+        keys = [translation_cache_key(self.settings, request) for request in requests]
+        cached = [self.cache.get(key) for key in keys]
+        # Identical paragraphs in one batch (repeated captions, scene breaks) are sent
+        # once; every occurrence is filled from that single translation.
+        first_miss: dict[str, int] = {}
+        for index, text in enumerate(cached):
+            if text is None:
+                first_miss.setdefault(keys[index], index)
+        misses = list(first_miss.values())
+        if misses:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Translation cache batch | hits=%s misses=%s",
+                    len(keys) - len(misses),
+                    len(misses),
+                )
+            miss_requests = [requests[index] for index in misses]
+            fresh: list[str | None]
+            partial: PartialBatchTranslationError | None = None
+            if len(miss_requests) > 1 and isinstance(self.translator, BatchTranslatorPort):
+                try:
+                    responses = self.translator.translate_batch(miss_requests)
+                    fresh = [response.translated_text for response in responses]
+                except PartialBatchTranslationError as exc:
+                    partial = exc
+                    fresh = exc.translations
+            else:
+                fresh = [self.translator.translate(r).translated_text for r in miss_requests]
+            fresh_by_key: dict[str, str] = {}
+            for index, text in zip(misses, fresh):
+                if text is not None:
+                    self.cache.put(keys[index], text)
+                    fresh_by_key[keys[index]] = text
+            cached = [
+                fresh_by_key.get(key) if text is None else text for key, text in zip(keys, cached)
+            ]
+            if partial is not None:
+                # Re-index the accepted paragraphs onto the caller's full request list.
+                raise PartialBatchTranslationError(str(partial), translations=cached)
+        return [TranslationResponse(translated_text=str(text)) for text in cached]
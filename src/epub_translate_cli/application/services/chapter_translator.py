@@ -1,40 +1,48 @@
 from __future__ import annotations
 
-import re
+import logging
 import time
 from collections import deque
+from concurrent.futures import Future, wait
 from dataclasses import dataclass, field
-from typing import Callable
+from typing import Callable, Optional
 
 from lxml import etree
 
-from epub_translate_cli.domain.errors import NonRetryableTranslationError, RetryableTranslationError
+from epub_translate_cli.application.services.shared_pools import shared_pool
+from epub_translate_cli.domain.errors import (
+    NonRetryableTranslationError,
+    PartialBatchTranslationError,
+    RetryableTranslationError,
+)
 from epub_translate_cli.domain.models import (
     ChapterDocument,
     ChapterTranslationResult,
     NodeChange,
     NodeFailure,
     NodeSkip,
+    SkipReason,
     TranslatableNode,
     TranslationRequest,
     TranslationSettings,
 )
-from epub_translate_cli.domain.ports import TranslatorPort
+from epub_translate_cli.domain.ports import BatchTranslatorPort, TranslatorPort
 from epub_translate_cli.infrastructure.epub.xhtml_parser import (
     REPORT_FIELD_MAX_CHARS,
     XHTMLTranslator,
     _backoff_seconds,
     _format_prior_pairs,
     _limit,
-    skip_reason,
+    skip_reasons,
+    strip_fences,
 )
 from epub_translate_cli.infrastructure.logging.logger_factory import create_logger
 
 logger = create_logger(__name__)
 
-_FENCE_RE = re.compile(r"^<<<\s*|\s*>>>$")
-
 _NodePair = tuple[etree._Element, TranslatableNode]
+# Evaluated at import time, so spelled with Optional for Python 3.9.
+_Attempt = tuple[Optional[str], int, Optional[Exception]]
 
 # XML attribute added to every translatable node before its turn arrives.
 # Removed once the node is processed (translated or failed).
@@ -69,7 +77,10 @@ class ChapterTranslator:
           disappear one by one as work progresses.
         """
         root, nodes = self.xhtml_parser.parse_chapter(chapter)
-        chapter_ctx = self.xhtml_parser.chapter_context(root)
+        # Candidate nodes already carry their text; reuse it rather than re-walking <p>s.
+        chapter_ctx = self.xhtml_parser.paragraph_context(
+            node.source_text for _, node in nodes if node.tag == "p"
+        )
         result = self._translate_nodes(
             chapter.path,
             chapter_ctx,
@@ -77,6 +88,10 @@ class ChapterTranslator:
             root=root,
             on_progress=on_progress,
         )
+        if not result.changes:
+            # Nothing was rewritten (e.g. a chapter that is all <head>/<nav> or skipped
+            # paragraphs); the source bytes are already the chapter's output.
+            return chapter.xhtml_bytes, result
         updated = self.xhtml_parser.serialize_chapter(root)
         return updated, result
 
@@ -95,51 +110,26 @@ class ChapterTranslator:
         context_size = self.settings.context_paragraphs
         recent_pairs: deque[tuple[str, str]] = deque(maxlen=context_size if context_size > 0 else 1)
 
-        # Pre-scan: mark every node that will be translated as pending so the
-        # staging file shows all untranslated paragraphs from the very first write.
-        pending_ids: set[int] = set()
-        for elem, node in nodes:
-            if skip_reason(elem) is None and node.source_text:
+        # Pre-scan: classify every node once, and mark the ones that will be translated
+        # as pending so the staging file shows all untranslated paragraphs from the
+        # very first write.
+        reasons = skip_reasons(root, (elem for elem, _ in nodes))
+        jobs = [
+            (elem, node, _node_skip_reason(node, reason))
+            for (elem, node), reason in zip(nodes, reasons)
+        ]
+        has_pending = False
+        for elem, _, reason in jobs:
+            if reason is None:
                 elem.set(_PENDING_ATTR, "true")
-                pending_ids.add(id(elem))
+                has_pending = True
 
         # Write the initial state: all pending markers visible, no translations yet.
-        if on_progress is not None and pending_ids:
+        if on_progress is not None and has_pending:
             on_progress(self.xhtml_parser.serialize_chapter(root))
 
-        for elem, node in nodes:
-            reason = skip_reason(elem)
-            if reason is not None:
-                skips.append(
-                    NodeSkip(
-                        chapter_path=node.chapter_path,
-                        node_path=node.node_path,
-                        reason=reason,
-                    )
-                )
-                continue
-            if not node.source_text:
-                skips.append(
-                    NodeSkip(
-                        chapter_path=node.chapter_path,
-                        node_path=node.node_path,
-                        reason="empty",
-                    )
-                )
-                continue
-
-            # Remove the pending marker before attempting translation.
-            # Whether translation succeeds or fails, this node is no longer "pending".
-            if _PENDING_ATTR in elem.attrib:
-                del elem.attrib[_PENDING_ATTR]
-
-            translated, attempts, error = self._translate_with_retries(
-                elem=elem,
-                node=node,
-                chapter_context=chapter_context,
-                prior_translations=_format_prior_pairs(recent_pairs, context_size),
-            )
-
+        def record(elem: etree._Element, node: TranslatableNode, outcome: _Attempt) -> None:
+            translated, attempts, error = outcome
             if translated is None:
                 failures.append(
                     NodeFailure(
@@ -151,7 +141,7 @@ class ChapterTranslator:
                         attempts=attempts,
                     )
                 )
-                continue
+                return
 
             self.xhtml_parser.replace_node_text(elem, translated)
             changes.append(
@@ -162,11 +152,12 @@ class ChapterTranslator:
                     after=_limit(translated, REPORT_FIELD_MAX_CHARS),
                 )
             )
-            logger.debug(
-                "Translated node | chapter=%s node=%s",
-                chapter_path,
-                node.node_path,
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Translated node | chapter=%s node=%s",
+                    chapter_path,
+                    node.node_path,
+                )
             if context_size > 0:
                 recent_pairs.append((node.source_text, translated))
 
@@ -175,23 +166,173 @@ class ChapterTranslator:
             if on_progress is not None:
                 on_progress(self.xhtml_parser.serialize_chapter(root))
 
+        # Translatable nodes are sent in groups of `batch_size` (one provider call per
+        # group); rolling context advances between groups. Up to `lookahead` groups may
+        # be in flight while the oldest one is still being decoded. Without rolling
+        # context the paragraphs are independent, so this is a plain parallel fan-out.
+        # Only the LLM call runs on pool threads; lxml mutation, reporting and progress
+        # writes stay on this thread in document order.
+        lookahead = self.settings.paragraph_lookahead
+        batch_size = self._batch_size()
+        inflight: deque[tuple[list[_NodePair], Future[list[_Attempt]]]] = deque()
+        # Paragraph requests of every chapter share one process-wide pool; the `inflight`
+        # window caps this chapter at `lookahead + 1` concurrent groups.
+        executor = shared_pool("paragraph") if lookahead > 0 else None
+
+        def settle(group: list[_NodePair], outcomes: list[_Attempt]) -> None:
+            for (elem, node), outcome in zip(group, outcomes):
+                record(elem, node, outcome)
+
+        def dispatch(group: list[_NodePair]) -> None:
+            while len(inflight) > lookahead:
+                pending_group, future = inflight.popleft()
+                settle(pending_group, future.result())
+
+            # Remove the pending markers before attempting translation.
+            # Whether translation succeeds or fails, these nodes are no longer "pending".
+            for elem, _ in group:
+                if _PENDING_ATTR in elem.attrib:
+                    del elem.attrib[_PENDING_ATTR]
+
+            group_nodes = [node for _, node in group]
+            prior_translations = _format_prior_pairs(
+                recent_pairs,
+                context_size,
+                self.settings.context_token_budget,
+            )
+            if executor is None:
+                settle(
+                    group,
+                    self._translate_group(group_nodes, chapter_context, prior_translations),
+                )
+                return
+            future = executor.submit(
+                self._translate_group, group_nodes, chapter_context, prior_translations
+            )
+            inflight.append((group, future))
+
+        try:
+            group: list[_NodePair] = []
+            for elem, node, reason in jobs:
+                if reason is not None:
+                    skips.append(
+                        NodeSkip(
+                            chapter_path=node.chapter_path,
+                            node_path=node.node_path,
+                            reason=reason,
+                        )
+                    )
+                    continue
+                group.append((elem, node))
+                if len(group) == batch_size:
+                    dispatch(group)
+                    group = []
+            if group:
+                dispatch(group)
+
+            while inflight:
+                pending_group, future = inflight.popleft()
+                settle(pending_group, future.result())
+        finally:
+            # Drop groups not yet started if this chapter failed, and let running ones
+            # finish before the tree they belong to is handed back.
+            for _, future in inflight:
+                future.cancel()
+            wait([future for _, future in inflight])
+
         return ChapterTranslationResult(changes=changes, failures=failures, skips=skips)
 
-    def _translate_with_retries(
+    def _batch_size(self) -> int:
+        """Return paragraphs per provider call; batching needs a BatchTranslatorPort."""
+        if isinstance(self.translator, BatchTranslatorPort):
+            return max(1, self.settings.paragraph_batch_size)
+        return 1
+
+    def _request(
         self,
-        *,
-        elem: etree._Element,
         node: TranslatableNode,
         chapter_context: str,
         prior_translations: str,
-    ) -> tuple[str | None, int, Exception | None]:
-        request = TranslationRequest(
+    ) -> TranslationRequest:
+        return TranslationRequest(
             chapter_context=chapter_context,
             text=node.source_text,
             prior_translations=prior_translations,
             glossary_terms=self.glossary_terms,
         )
 
+    def _translate_group(
+        self,
+        nodes: list[TranslatableNode],
+        chapter_context: str,
+        prior_translations: str,
+    ) -> list[_Attempt]:
+        """Translate a group of nodes, batched when possible, else one request per node."""
+        if len(nodes) > 1:
+            outcomes = self._translate_batch(nodes, chapter_context, prior_translations)
+            if outcomes is not None:
+                return outcomes
+        return [
+            self._translate_with_retries(
+                node=node,
+                chapter_context=chapter_context,
+                prior_translations=prior_translations,
+            )
+            for node in nodes
+        ]
+
+    def _translate_batch(
+        self,
+        nodes: list[TranslatableNode],
+        chapter_context: str,
+        prior_translations: str,
+    ) -> list[_Attempt] | None:
+        """Translate nodes with one batch call; None means fall back to single requests.
+
+        Batch failures are not retried here: the per-node fallback has its own retries.
+        """
+        assert isinstance(self.translator, BatchTranslatorPort)
+        requests = [self._request(node, chapter_context, prior_translations) for node in nodes]
+        try:
+            responses = self.translator.translate_batch(requests)
+        except PartialBatchTranslationError as exc:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Batch partially rejected, retrying paragraphs alone | nodes=%s error=%s",
+                    len(nodes),
+                    str(exc),
+                )
+            return [
+                (strip_fences(text), 1, None)
+                if text is not None
+                else self._translate_with_retries(
+                    node=node,
+                    chapter_context=chapter_context,
+                    prior_translations=prior_translations,
+                )
+                for node, text in zip(nodes, exc.translations)
+            ]
+        except (RetryableTranslationError, NonRetryableTranslationError) as exc:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Batch failed, falling back to single paragraphs | nodes=%s error=%s",
+                    len(nodes),
+                    str(exc),
+                )
+            return None
+        if len(responses) != len(nodes):
+            return None
+        return [(strip_fences(response.translated_text), 1, None) for response in responses]
+
+    def _translate_with_retries(
+        self,
+        *,
+        node: TranslatableNode,
+        chapter_context: str,
+        prior_translations: str,
+    ) -> _Attempt:
+        request = self._request(node, chapter_context, prior_translations)
+
         attempts = 0
         last_error: Exception | None = None
 
@@ -199,7 +340,7 @@ class ChapterTranslator:
             attempts = attempt + 1
             try:
                 raw = self.translator.translate(request).translated_text
-                return _FENCE_RE.sub("", raw).strip(), attempts, None
+                return strip_fences(raw), attempts, None
             except RetryableTranslationError as exc:
                 last_error = exc
                 logger.debug(
@@ -209,7 +350,7 @@ class ChapterTranslator:
                     self.settings.retries + 1,
                     str(exc),
                 )
-                time.sleep(_backoff_seconds(attempt))
+                time.sleep(_backoff_seconds(attempt, exc.retry_after))
             except NonRetryableTranslationError as exc:
                 last_error = exc
                 logger.debug(
@@ -221,3 +362,10 @@ class ChapterTranslator:
                 break
 
         return None, attempts, last_error
+
+
+def _node_skip_reason(node: TranslatableNode, reason: SkipReason | None) -> SkipReason | None:
+    """Return why a node is not sent for translation, or None when it should be."""
+    if reason is None and not node.source_text:
+        return "empty"
+    return reason
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import atexit
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Upper bound on threads per shared pool; matches the CLI's `--workers` limit and the
+# Ollama adapter's keep-alive connection pool.
+SHARED_POOL_MAX_WORKERS = 32
+
+_pools: dict[str, ThreadPoolExecutor] = {}
+_pools_lock = threading.Lock()
+
+
+def shared_pool(name: str) -> ThreadPoolExecutor:
+    """Return the process-wide thread pool called `name`, creating it on first use.
+
+    Pools are never resized or shut down while the process runs, so concurrent runs can
+    keep submitting to them. Threads start lazily, one per concurrently running task,
+    and callers bound their own concurrency by how many futures they keep in flight.
+    """
+    with _pools_lock:
+        pool = _pools.get(name)
+        if pool is None:
+            pool = ThreadPoolExecutor(
+                max_workers=SHARED_POOL_MAX_WORKERS, thread_name_prefix=f"epub-{name}"
+            )
+            _pools[name] = pool
+        return pool
+
+
+@atexit.register
+def _shutdown_shared_pools() -> None:
+    """Join shared pool threads at interpreter exit."""
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=True)
+        _pools.clear()
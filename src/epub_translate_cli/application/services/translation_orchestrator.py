@@ -1,16 +1,21 @@
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import logging
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, wait
 from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
-from typing import NamedTuple
+from typing import NamedTuple, cast
 
+from epub_translate_cli.application.services.shared_pools import shared_pool
 from epub_translate_cli.domain.errors import EpubReadError, EpubWriteError
 from epub_translate_cli.domain.models import (
     ChapterDocument,
     ChapterReport,
     ChapterTranslationResult,
     EpubBook,
+    ItemOverlay,
     RunReport,
     StagedChapter,
     TranslationRunResult,
@@ -54,60 +59,65 @@ class TranslationOrchestrator:
     ) -> TranslationRunResult:
         """Translate an EPUB and produce translated output and report artifacts."""
         book = self._load_book(input_path)
+        try:
+            if reset_resume_state:
+                logger.info("Resetting staged resume workspace before translation")
+                self.stage_store.clear()
 
-        if reset_resume_state:
-            logger.info("Resetting staged resume workspace before translation")
-            self.stage_store.clear()
-
-        resumed = self.stage_store.load_completed()
-        logger.info("Loaded EPUB | chapters=%s workers=%s", len(book.chapters), settings.workers)
-        if resumed:
-            logger.info("Resuming run from staged chapters | completed=%s", len(resumed))
-
-        chapter_overrides, chapter_reports = self._translate_chapters(
-            book,
-            settings.workers,
-            resumed,
-        )
-        updated_items = self._merged_items(book.items, chapter_overrides)
-
-        failures_count = sum(len(r.failures) for r in chapter_reports)
-        output_written, exit_code = self._write_output_if_allowed(
-            updated_items=updated_items,
-            chapters=book.chapters,
-            compression_types=book.compression_types,
-            output_path=output_path,
-            abort_on_error=settings.abort_on_error,
-            failures_count=failures_count,
-        )
-
-        report = self._build_run_report(
-            input_path=input_path,
-            output_path=output_path,
-            report_path=report_path,
-            settings=settings,
-            chapter_reports=chapter_reports,
-            output_written=output_written,
-        )
-        self.report_writer.write(report, report_path)
+            resumed = self.stage_store.load_completed()
+            logger.info(
+                "Loaded EPUB | chapters=%s workers=%s", len(book.chapters), settings.workers
+            )
+            if resumed:
+                logger.info("Resuming run from staged chapters | completed=%s", len(resumed))
 
-        if output_written:
-            self.stage_store.clear()
+            chapter_overrides, chapter_reports = self._translate_chapters(
+                book,
+                settings.workers,
+                resumed,
+            )
+            updated_items = self._merged_items(book.items, chapter_overrides)
+
+            failures_count = sum(len(r.failures) for r in chapter_reports)
+            output_written, exit_code = self._write_output_if_allowed(
+                updated_items=updated_items,
+                chapters=book.chapters,
+                compression_types=book.compression_types,
+                output_path=output_path,
+                abort_on_error=settings.abort_on_error,
+                failures_count=failures_count,
+            )
 
-        totals = report.totals()
-        logger.info(
-            "Run completed | changed=%s failed=%s skipped=%s output_written=%s",
-            totals["changed"],
-            totals["failed"],
-            totals["skipped"],
-            output_written,
-        )
+            report = self._build_run_report(
+                input_path=input_path,
+                output_path=output_path,
+                report_path=report_path,
+                settings=settings,
+                chapter_reports=chapter_reports,
+                output_written=output_written,
+            )
+            self.report_writer.write(report, report_path)
+
+            if output_written:
+                self.stage_store.clear()
+
+            totals = report.totals()
+            logger.info(
+                "Run completed | changed=%s failed=%s skipped=%s output_written=%s",
+                totals["changed"],
+                totals["failed"],
+                totals["skipped"],
+                output_written,
+            )
 
-        return TranslationRunResult(
-            output_written=output_written,
-            failures=totals["failed"],
-            exit_code=exit_code,
-        )
+            return TranslationRunResult(
+                output_written=output_written,
+                failures=totals["failed"],
+                exit_code=exit_code,
+            )
+        finally:
+            # Lazy items keep the source archive open until the run is over.
+            self.epub_repository.close(book)
 
     def _load_book(self, input_path: Path) -> EpubBook:
         """Load input EPUB via repository adapter and normalize read errors."""
@@ -142,16 +152,15 @@ class TranslationOrchestrator:
     @staticmethod
     def _ordered_reports(chapter_reports: list[ChapterReport | None]) -> list[ChapterReport]:
         """Return ordered chapter reports after validating all entries are populated."""
-        missing = sum(1 for r in chapter_reports if r is None)
-        assert missing == 0, f"Missing chapter reports for {missing} chapters"
-        return [r for r in chapter_reports if r is not None]
+        assert None not in chapter_reports, (
+            f"Missing chapter reports for {chapter_reports.count(None)} chapters"
+        )
+        return cast("list[ChapterReport]", chapter_reports)
 
     @staticmethod
-    def _merged_items(
-        base_items: dict[str, bytes], overrides: dict[str, bytes]
-    ) -> dict[str, bytes]:
-        """Merge chapter overrides into original EPUB item payload map."""
-        return {**base_items, **overrides}
+    def _merged_items(base_items: Mapping[str, bytes], overrides: dict[str, bytes]) -> ItemOverlay:
+        """Layer chapter overrides over the original EPUB items without copying them."""
+        return ItemOverlay(base=base_items, overrides=overrides)
 
     def _translate_chapters(
         self,
@@ -159,11 +168,18 @@ class TranslationOrchestrator:
         workers: int,
         resumed: dict[int, StagedChapter],
     ) -> tuple[dict[str, bytes], list[ChapterReport]]:
-        """Translate pending chapters and merge with resumed staged chapter snapshots."""
+        """Translate pending chapters and merge with resumed staged chapter snapshots.
+
+        The returned mapping holds only chapters whose bytes changed.
+        """
         works = self._chapter_works(book.chapters)
         resumed_indexes = set(resumed)
         pending_works = [work for work in works if (work.chapter_index - 1) not in resumed_indexes]
-        updated_items = {staged.chapter_path: staged.xhtml_bytes for staged in resumed.values()}
+        updated_items = {
+            staged.chapter_path: staged.xhtml_bytes
+            for staged in resumed.values()
+            if staged.report.changes
+        }
         chapter_reports: list[ChapterReport | None] = [None] * len(book.chapters)
         for staged in resumed.values():
             chapter_reports[staged.chapter_index] = staged.report
@@ -171,25 +187,53 @@ class TranslationOrchestrator:
         if not pending_works:
             return updated_items, self._ordered_reports(chapter_reports)
 
-        with ThreadPoolExecutor(max_workers=workers) as pool:
-            futures = {
-                pool.submit(self._translate_one_chapter, work): work for work in pending_works
-            }
-            for future in as_completed(futures):
-                index, updated_xhtml, result = future.result()
-                chapter = book.chapters[index]
-                updated_items[chapter.path] = updated_xhtml
-                chapter_report = self._chapter_report(chapter.path, result)
-                chapter_reports[index] = chapter_report
-                self.stage_store.save_chapter(
-                    chapter_index=index,
-                    chapter_path=chapter.path,
-                    xhtml_bytes=updated_xhtml,
-                    report=chapter_report,
-                )
+        # The chapter pool is shared by every run in the process; keeping exactly
+        # `workers` chapters in flight is what bounds this run's concurrency.
+        queued = iter(pending_works)
+        pool = shared_pool("chapter")
+        inflight: set[Future[tuple[int, bytes, ChapterTranslationResult]]] = {
+            pool.submit(self._translate_one_chapter, work) for work in islice(queued, workers)
+        }
+        try:
+            while inflight:
+                done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    next_work = next(queued, None)
+                    if next_work is not None:
+                        inflight.add(pool.submit(self._translate_one_chapter, next_work))
+                    self._record_chapter(book, future.result(), updated_items, chapter_reports)
+        finally:
+            # The pool outlives this run, so drop queued chapters of a failed run and wait
+            # for the running ones before returning control to the caller.
+            for future in inflight:
+                future.cancel()
+            wait(inflight)
 
         return updated_items, self._ordered_reports(chapter_reports)
 
+    def _record_chapter(
+        self,
+        book: EpubBook,
+        outcome: tuple[int, bytes, ChapterTranslationResult],
+        updated_items: dict[str, bytes],
+        chapter_reports: list[ChapterReport | None],
+    ) -> None:
+        """Store one finished chapter's bytes and report, and persist it to the stage store."""
+        index, updated_xhtml, result = outcome
+        chapter = book.chapters[index]
+        # Only translated chapters enter the overlay; the rest resolve to the original
+        # items, so the repository copies their compressed records through untouched.
+        if result.changes:
+            updated_items[chapter.path] = updated_xhtml
+        chapter_report = self._chapter_report(chapter.path, result)
+        chapter_reports[index] = chapter_report
+        self.stage_store.save_chapter(
+            chapter_index=index,
+            chapter_path=chapter.path,
+            xhtml_bytes=updated_xhtml,
+            report=chapter_report,
+        )
+
     def _translate_one_chapter(
         self,
         work: _ChapterWork,
@@ -219,13 +263,14 @@ class TranslationOrchestrator:
             work.chapter,
             on_progress=_on_progress,
         )
-        logger.debug(
-            "Chapter completed | path=%s changed=%s failed=%s skipped=%s",
-            work.chapter.path,
-            len(result.changes),
-            len(result.failures),
-            len(result.skips),
-        )
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Chapter completed | path=%s changed=%s failed=%s skipped=%s",
+                work.chapter.path,
+                len(result.changes),
+                len(result.failures),
+                len(result.skips),
+            )
         return chapter_index, updated_xhtml, result
 
     @staticmethod
@@ -256,7 +301,7 @@ class TranslationOrchestrator:
     def _write_output_if_allowed(
         self,
         *,
-        updated_items: dict[str, bytes],
+        updated_items: Mapping[str, bytes],
         chapters: list[ChapterDocument],
         compression_types: dict[str, int],
         output_path: Path,
@@ -1,17 +1,27 @@
 from __future__ import annotations
 
 import json
+import os
 import time
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Annotated
+from typing import Annotated, Optional
 
 import typer
 from rich.console import Console
 
+from epub_translate_cli.application.services.caching_translator import CachingTranslator
 from epub_translate_cli.application.services.chapter_translator import ChapterTranslator
+from epub_translate_cli.application.services.shared_pools import SHARED_POOL_MAX_WORKERS
 from epub_translate_cli.application.services.translation_orchestrator import TranslationOrchestrator
 from epub_translate_cli.domain.models import TranslationRunResult, TranslationSettings
+from epub_translate_cli.domain.ports import TranslatorPort
+from epub_translate_cli.infrastructure.cache.memory_translation_cache import (
+    InMemoryTranslationCache,
+)
+from epub_translate_cli.infrastructure.cache.sqlite_translation_cache import (
+    SqliteTranslationCache,
+)
 from epub_translate_cli.infrastructure.epub.epub_repository import ZipEpubRepository
 from epub_translate_cli.infrastructure.epub.xhtml_parser import XHTMLTranslator
 from epub_translate_cli.infrastructure.llm.ollama_translator import OllamaTranslator
@@ -32,6 +42,9 @@ from epub_translate_cli.infrastructure.reporting.json_report_writer import JsonR
 console = Console()
 logger = create_logger(__name__)
 
+# Upper bound of `--workers`; also the size of the shared chapter pool.
+MAX_WORKERS = SHARED_POOL_MAX_WORKERS
+
 
 @dataclass(frozen=True)
 class TranslateCommand:
@@ -53,6 +66,10 @@ class TranslateCommand:
     reset_resume_state: bool
     ollama_timeout_s: float
     glossary_path: Path | None = None
+    translation_cache_path: Path | None = None
+    context_token_budget: int = 256
+    paragraph_lookahead: int = 0
+    paragraph_batch_size: int = 1
 
 
 def _abort(msg: str) -> None:
@@ -69,6 +86,19 @@ def _validate_input_path(input_path: Path) -> None:
         _abort(f"--in must point to a file, not a directory: {input_path}")
 
 
+def _default_workers() -> int:
+    """Return OLLAMA_NUM_PARALLEL clamped to the `--workers` range, or 1 when unset/invalid.
+
+    The variable configures the Ollama server, so values above the CLI limit are capped
+    rather than rejected.
+    """
+    try:
+        parallel = int(os.environ.get("OLLAMA_NUM_PARALLEL", ""))
+    except ValueError:
+        return 1
+    return min(max(parallel, 1), MAX_WORKERS)
+
+
 def _resolve_report_path(output_path: Path, report_out: Path | None) -> Path:
     """Resolve report output path from flag or derived default."""
     return report_out or output_path.with_suffix(output_path.suffix + ".report.json")
@@ -92,6 +122,10 @@ def _build_command(
     context_paragraphs: int,
     reset_resume_state: bool,
     glossary_path: Path | None,
+    translation_cache_path: Path | None = None,
+    context_token_budget: int = 256,
+    paragraph_lookahead: int = 0,
+    paragraph_batch_size: int = 1,
 ) -> TranslateCommand:
     """Build immutable validated command object from raw CLI arguments."""
     _validate_input_path(input_path)
@@ -113,6 +147,10 @@ def _build_command(
         context_paragraphs=context_paragraphs,
         reset_resume_state=reset_resume_state,
         glossary_path=glossary_path,
+        translation_cache_path=translation_cache_path,
+        context_token_budget=context_token_budget,
+        paragraph_lookahead=paragraph_lookahead,
+        paragraph_batch_size=paragraph_batch_size,
     )
 
 
@@ -127,6 +165,9 @@ def _build_settings(command: TranslateCommand) -> TranslationSettings:
         abort_on_error=command.abort_on_error,
         workers=command.workers,
         context_paragraphs=command.context_paragraphs,
+        context_token_budget=command.context_token_budget,
+        paragraph_lookahead=command.paragraph_lookahead,
+        paragraph_batch_size=command.paragraph_batch_size,
     )
 
 
@@ -156,12 +197,23 @@ def _run_translation(
 ) -> tuple[TranslationRunResult, float]:
     """Wire all adapters and execute the orchestrator translation run."""
     glossary_terms = _load_glossary_terms(command.glossary_path)
-    translator = OllamaTranslator(
+    translator: TranslatorPort = OllamaTranslator(
         settings=settings,
         base_url=command.ollama_url,
         timeout_s=command.ollama_timeout_s,
         prompt_builder=GlossaryAwarePromptBuilder(),
     )
+    persistent_cache = (
+        SqliteTranslationCache(command.translation_cache_path)
+        if command.translation_cache_path is not None
+        else None
+    )
+    # Without the persistent cache, repeated text is still deduplicated within the run.
+    translator = CachingTranslator(
+        translator=translator,
+        settings=settings,
+        cache=persistent_cache or InMemoryTranslationCache(),
+    )
     chapter_processor = ChapterTranslator(
         translator=translator,
         settings=settings,
@@ -182,13 +234,17 @@ def _run_translation(
     )
 
     start = time.perf_counter()
-    result = orchestrator.translate_epub(
-        input_path=command.input_path,
-        output_path=command.output_path,
-        report_path=command.report_path,
-        settings=settings,
-        reset_resume_state=command.reset_resume_state,
-    )
+    try:
+        result = orchestrator.translate_epub(
+            input_path=command.input_path,
+            output_path=command.output_path,
+            report_path=command.report_path,
+            settings=settings,
+            reset_resume_state=command.reset_resume_state,
+        )
+    finally:
+        if persistent_cache is not None:
+            persistent_cache.close()
     elapsed = time.perf_counter() - start
     return result, elapsed
 
@@ -213,6 +269,8 @@ def _print_summary(
     )
 
 
+# Typer evaluates these annotations at runtime, so optional options are spelled with
+# `Optional` for Python 3.9, where `X | None` is not valid at runtime.
 def translate(
     in_path: Annotated[Path, typer.Option("--in", help="Input EPUB file path")],
     out_path: Annotated[Path, typer.Option("--out", help="Output translated EPUB file path")],
@@ -221,7 +279,7 @@ def translate(
     model: Annotated[str, typer.Option("--model", help="Ollama model for translation")],
     temperature: Annotated[float, typer.Option("--temperature", min=0.0, max=2.0)] = 0.2,
     retries: Annotated[int, typer.Option("--retries", min=0, max=10)] = 3,
-    report_out: Annotated[Path | None, typer.Option("--report-out")] = None,
+    report_out: Annotated[Optional[Path], typer.Option("--report-out")] = None,  # noqa: UP045
     abort_on_error: Annotated[bool, typer.Option("--abort-on-error")] = False,
     log_level: Annotated[
         str,
@@ -232,21 +290,67 @@ def translate(
         typer.Option("--ollama-url", help="Ollama API base URL for the translation model"),
     ] = "http://localhost:11434",
     workers: Annotated[
-        int,
-        typer.Option("--workers", min=1, max=32, help="Parallel chapter workers"),
-    ] = 1,
+        Optional[int],  # noqa: UP045
+        typer.Option(
+            "--workers",
+            min=1,
+            max=MAX_WORKERS,
+            show_default=False,
+            help=(
+                "Parallel chapter workers [default: OLLAMA_NUM_PARALLEL when set, "
+                f"capped at {MAX_WORKERS}, else 1]"
+            ),
+        ),
+    ] = None,
     context_paragraphs: Annotated[
         int,
         typer.Option(
             "--context-paragraphs",
             min=0,
-            max=20,
+            max=5,
             help=(
                 "Rolling context: number of preceding translated paragraphs "
                 "per request (0 to disable)"
             ),
         ),
-    ] = 3,
+    ] = 2,
+    context_token_budget: Annotated[
+        int,
+        typer.Option(
+            "--context-token-budget",
+            min=0,
+            max=4096,
+            help=(
+                "Approximate token cap for the rolling context block; older pairs are "
+                "dropped first (0 for no cap)"
+            ),
+        ),
+    ] = 256,
+    paragraph_lookahead: Annotated[
+        int,
+        typer.Option(
+            "--paragraph-lookahead",
+            min=0,
+            max=16,
+            help=(
+                "Paragraph requests sent ahead of the one being decoded; lookahead requests "
+                "miss the newest rolling-context pairs, so with --context-paragraphs 0 this "
+                "is free parallelism (0 to disable)"
+            ),
+        ),
+    ] = 0,
+    paragraph_batch_size: Annotated[
+        int,
+        typer.Option(
+            "--paragraph-batch-size",
+            min=1,
+            max=32,
+            help=(
+                "Paragraphs translated per Ollama request; rolling context only advances "
+                "between batches (1 to disable batching)"
+            ),
+        ),
+    ] = 1,
     reset_resume_state: Annotated[
         bool,
         typer.Option(
@@ -262,12 +366,23 @@ def translate(
         ),
     ] = -1.0,
     glossary: Annotated[
-        Path | None,
+        Optional[Path],  # noqa: UP045
         typer.Option(
             "--glossary",
             help="Optional glossary file (.toml or .json) with term→translation mappings",
         ),
     ] = None,
+    translation_cache: Annotated[
+        bool,
+        typer.Option(
+            "--translation-cache/--no-translation-cache",
+            help=(
+                "Reuse translations of identical text across runs from a persistent cache "
+                "(~/.cache/epub-translate-cli/translations.sqlite). Cached text is replayed "
+                "regardless of the surrounding chapter context"
+            ),
+        ),
+    ] = False,
 ) -> None:
     """Translate an EPUB using a local Ollama model."""
     command = _build_command(
@@ -283,10 +398,14 @@ def translate(
         log_level=log_level,
         ollama_url=ollama_url,
         ollama_timeout_s=ollama_timeout,
-        workers=workers,
+        workers=workers if workers is not None else _default_workers(),
         context_paragraphs=context_paragraphs,
         reset_resume_state=reset_resume_state,
         glossary_path=glossary,
+        translation_cache_path=SqliteTranslationCache.default_path() if translation_cache else None,
+        context_token_budget=context_token_budget,
+        paragraph_lookahead=paragraph_lookahead,
+        paragraph_batch_size=paragraph_batch_size,
     )
 
     configure_logging(command.log_level)
@@ -18,7 +18,26 @@ class TranslationError(EpubTranslatorError):
 
 
 class RetryableTranslationError(TranslationError):
-    """Retryable translation error (transient)."""
+    """Retryable translation error (transient).
+
+    `retry_after` carries the provider's requested delay in seconds, when it sent one.
+    """
+
+    def __init__(self, message: str = "", *, retry_after: float | None = None) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class PartialBatchTranslationError(RetryableTranslationError):
+    """Batch reply aligned with its requests, but some paragraphs failed validation.
+
+    `translations` holds one entry per request in order: the accepted text, or None for
+    paragraphs that should be re-requested on their own.
+    """
+
+    def __init__(self, message: str, *, translations: list[str | None]) -> None:
+        super().__init__(message)
+        self.translations = translations
 
 
 class NonRetryableTranslationError(TranslationError):
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from typing import Any, Literal
 
@@ -26,7 +27,10 @@ class TranslationSettings:
     retries: int
     abort_on_error: bool
     workers: int = 1
-    context_paragraphs: int = 3
+    context_paragraphs: int = 2
+    context_token_budget: int = 256
+    paragraph_lookahead: int = 0
+    paragraph_batch_size: int = 1
 
 
 @dataclass(frozen=True)
@@ -41,18 +45,48 @@ class ChapterDocument:
 class EpubBook:
     """In-memory EPUB representation used by the application layer.
 
-    `items` maps internal EPUB path -> bytes content.
+    `items` maps internal EPUB path -> bytes content. Repositories may return a lazy
+    mapping that only reads a member when it is accessed.
     `chapters` contains parsed XHTML chapters derived from items.
     `compression_types` maps each path to its original ZIP compression constant.
 
     Keeping all three allows faithful round-trip with minimal loss.
     """
 
-    items: dict[str, bytes]
+    items: Mapping[str, bytes]
     chapters: list[ChapterDocument]
     compression_types: dict[str, int]
 
 
+@dataclass(frozen=True)
+class ItemOverlay(Mapping[str, bytes]):
+    """Read-only view of EPUB items with replaced payloads layered over a base mapping.
+
+    Lookups hit `overrides` first and fall back to `base`, so the base items are never
+    copied or materialized. Iteration yields base paths first, in their original order.
+    """
+
+    base: Mapping[str, bytes]
+    overrides: Mapping[str, bytes]
+
+    def __getitem__(self, path: str) -> bytes:
+        if path in self.overrides:
+            return self.overrides[path]
+        return self.base[path]
+
+    def __contains__(self, path: object) -> bool:
+        return path in self.overrides or path in self.base
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self.base
+        for path in self.overrides:
+            if path not in self.base:
+                yield path
+
+    def __len__(self) -> int:
+        return len(self.base) + sum(1 for path in self.overrides if path not in self.base)
+
+
 @dataclass(frozen=True)
 class GlossaryEntry:
     """One term→translation pair in a user-supplied glossary."""
@@ -76,6 +110,8 @@ class Glossary:
 class TranslatableNode:
     """Resolved translatable node payload used by chapter parser pipeline."""
 
+    __slots__ = ("chapter_path", "node_path", "tag", "source_text")
+
     chapter_path: str
     node_path: str
     tag: TranslatableTag
@@ -100,6 +136,8 @@ class TranslationRequest:
 class TranslationResponse:
     """Output payload returned by translator adapters."""
 
+    __slots__ = ("translated_text",)
+
     translated_text: str
 
 
@@ -114,6 +152,8 @@ SkipReason = Literal[
 class NodeChange:
     """One successfully translated node diff entry for reporting."""
 
+    __slots__ = ("chapter_path", "node_path", "before", "after")
+
     chapter_path: str
     node_path: str
     before: str
@@ -124,6 +164,8 @@ class NodeChange:
 class NodeFailure:
     """One failed node translation entry for reporting."""
 
+    __slots__ = ("chapter_path", "node_path", "text", "error_type", "message", "attempts")
+
     chapter_path: str
     node_path: str
     text: str
@@ -136,6 +178,8 @@ class NodeFailure:
 class NodeSkip:
     """One skipped node entry describing why translation was not attempted."""
 
+    __slots__ = ("chapter_path", "node_path", "reason")
+
     chapter_path: str
     node_path: str
     reason: SkipReason
@@ -145,6 +189,8 @@ class NodeSkip:
 class ChapterTranslationResult:
     """Per-chapter translation processing report produced by ChapterProcessorPort."""
 
+    __slots__ = ("changes", "failures", "skips")
+
     changes: list[NodeChange]
     failures: list[NodeFailure]
     skips: list[NodeSkip]
@@ -154,6 +200,8 @@ class ChapterTranslationResult:
 class ChapterReport:
     """Per-chapter report section used in final run report."""
 
+    __slots__ = ("chapter_path", "changes", "failures", "skips")
+
     chapter_path: str
     changes: tuple[NodeChange, ...]
     failures: tuple[NodeFailure, ...]
@@ -164,6 +212,8 @@ class ChapterReport:
 class StagedChapter:
     """Chapter bytes/report snapshot loaded from persistent staging workspace."""
 
+    __slots__ = ("chapter_index", "chapter_path", "xhtml_bytes", "report", "completed")
+
     chapter_index: int
     chapter_path: str
     xhtml_bytes: bytes
@@ -188,12 +238,17 @@ class RunReport:
     chapters: tuple[ChapterReport, ...]
 
     def totals(self) -> dict[str, Any]:
-        """Compute aggregate counters across all chapter report sections."""
+        """Compute aggregate counters across all chapter report sections in one pass."""
+        changed = failed = skipped = 0
+        for chapter in self.chapters:
+            changed += len(chapter.changes)
+            failed += len(chapter.failures)
+            skipped += len(chapter.skips)
         return {
             "chapters": len(self.chapters),
-            "changed": sum(len(c.changes) for c in self.chapters),
-            "failed": sum(len(c.failures) for c in self.chapters),
-            "skipped": sum(len(c.skips) for c in self.chapters),
+            "changed": changed,
+            "failed": failed,
+            "skipped": skipped,
         }
 
 
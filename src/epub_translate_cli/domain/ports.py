@@ -1,7 +1,8 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
 from pathlib import Path
-from typing import Callable, Protocol
+from typing import Callable, Protocol, runtime_checkable
 
 from epub_translate_cli.domain.models import (
     ChapterDocument,
@@ -28,6 +29,10 @@ class EpubRepositoryPort(Protocol):
         """Persist in-memory EPUB representation back to archive on disk."""
         ...
 
+    def close(self, book: EpubBook) -> None:
+        """Release resources (e.g. open archive handles) held by a loaded book."""
+        ...
+
 
 class TranslatorPort(Protocol):
     """Abstraction for text translation providers (e.g., Ollama)."""
@@ -37,6 +42,32 @@ class TranslatorPort(Protocol):
         ...
 
 
+@runtime_checkable
+class BatchTranslatorPort(TranslatorPort, Protocol):
+    """Translator that can also translate several paragraphs in one provider call."""
+
+    def translate_batch(self, requests: Sequence[TranslationRequest]) -> list[TranslationResponse]:
+        """Translate requests sharing one context and return responses in the same order.
+
+        Raises RetryableTranslationError when the provider reply cannot be aligned
+        one-to-one with the requests, or PartialBatchTranslationError when it can but
+        only some paragraphs were usable.
+        """
+        ...
+
+
+class TranslationCachePort(Protocol):
+    """Abstraction for storing translated text keyed by a request fingerprint."""
+
+    def get(self, key: str) -> str | None:
+        """Return cached translated text for key, or None on a miss."""
+        ...
+
+    def put(self, key: str, translated_text: str) -> None:
+        """Store translated text for key, replacing any previous entry."""
+        ...
+
+
 class ReportWriterPort(Protocol):
     """Abstraction for writing run reports to persistent storage."""
 
@@ -87,6 +118,10 @@ class PromptBuilderPort(Protocol):
         """Build the user role message: chapter context, prior translations, text to translate."""
         ...
 
+    def build_batch_user_prompt(self, requests: Sequence[TranslationRequest]) -> str:
+        """Build one user role message asking for numbered translations of all requests."""
+        ...
+
 
 class ChapterProcessorPort(Protocol):
     """Abstraction for translating one EPUB chapter and returning the updated XHTML bytes."""
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+
+from epub_translate_cli.domain.ports import TranslationCachePort
+
+# Entries kept per run; front matter and repeated headings fit comfortably.
+DEFAULT_MAX_ENTRIES: int = 4096
+
+
+class InMemoryTranslationCache(TranslationCachePort):
+    """Bounded least-recently-used translation cache that lives for one run.
+
+    Used when the persistent cache is disabled, so text repeated across chapters
+    (headings, dedications, author notes) is still translated only once per run.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        """Return cached translated text for key, or None on a miss."""
+        with self._lock:
+            translated_text = self._entries.get(key)
+            if translated_text is not None:
+                self._entries.move_to_end(key)
+            return translated_text
+
+    def put(self, key: str, translated_text: str) -> None:
+        """Store translated text for key, evicting the least recently used entry when full."""
+        with self._lock:
+            self._entries[key] = translated_text
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
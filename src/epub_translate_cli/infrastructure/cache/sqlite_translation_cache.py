@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+import threading
+from pathlib import Path
+
+from epub_translate_cli.domain.ports import TranslationCachePort
+from epub_translate_cli.infrastructure.logging.logger_factory import create_logger
+
+logger = create_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS translations (
+    key TEXT PRIMARY KEY,
+    translated_text TEXT NOT NULL
+)
+"""
+
+
+class SqliteTranslationCache(TranslationCachePort):
+    """Persistent translation cache stored in a single SQLite table.
+
+    One connection is shared by all chapter worker threads and serialized with a lock.
+    """
+
+    def __init__(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.path = path
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def default_path() -> Path:
+        """Return per-user cache location, honouring XDG_CACHE_HOME when set."""
+        cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+        return Path(cache_home) / "epub-translate-cli" / "translations.sqlite"
+
+    def get(self, key: str) -> str | None:
+        """Return cached translated text for key, or None on a miss."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT translated_text FROM translations WHERE key = ?", (key,)
+            ).fetchone()
+        return None if row is None else str(row[0])
+
+    def put(self, key: str, translated_text: str) -> None:
+        """Store translated text for key, replacing any previous entry."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO translations (key, translated_text) VALUES (?, ?)",
+                (key, translated_text),
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+        logger.debug("Translation cache closed | path=%s", self.path)
+
+    def __enter__(self) -> SqliteTranslationCache:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
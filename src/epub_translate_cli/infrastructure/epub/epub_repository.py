@@ -1,17 +1,228 @@
 from __future__ import annotations
 
+import copy
+import io
+import os
+import shutil
+import struct
+import sys
+import threading
+import time
 import zipfile
+import zlib
+from collections.abc import Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 from epub_translate_cli.domain.errors import EpubReadError, EpubWriteError
-from epub_translate_cli.domain.models import ChapterDocument, EpubBook
+from epub_translate_cli.domain.models import ChapterDocument, EpubBook, ItemOverlay
 from epub_translate_cli.domain.ports import EpubRepositoryPort
 from epub_translate_cli.infrastructure.epub.opf_spine_parser import OPFSpineParser
 from epub_translate_cli.infrastructure.logging.logger_factory import create_logger
 
 logger = create_logger(__name__)
 
+# ZIP local file header layout (APPNOTE 4.3.7); mirrors zipfile.structFileHeader.
+_LOCAL_HEADER = struct.Struct("<4s2B4HL2L2H")
+_LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+_FLAG_ENCRYPTED = 0x1
+_FLAG_DATA_DESCRIPTOR = 0x8
+_ZIP64_LIMIT = (1 << 31) - 1
+# Extra-field record header (APPNOTE 4.5.1) and the ZIP64 extended-information field id.
+_EXTRA_FIELD_HEADER = struct.Struct("<2H")
+_ZIP64_EXTRA_ID = 0x0001
+
+# File extensions (lowercase, without the dot) of members that may hold chapter markup.
+_CHAPTER_EXTENSIONS = frozenset({"xhtml", "html", "htm"})
+
+# Archive file handles use 64 KiB buffers so zip reads/writes issue fewer syscalls.
+_IO_BUFFER_SIZE = 64 * 1024
+
+
+def _load_deflate_lib() -> Any:
+    """Return ISA-L's zlib-compatible module when `isal` is installed, else stdlib zlib.
+
+    ISA-L provides SIMD-accelerated deflate and CRC32 with the same API as zlib.
+    """
+    try:
+        from isal import isal_zlib  # type: ignore[import-not-found,unused-ignore]
+
+        return isal_zlib
+    except ImportError:
+        return zlib
+
+
+_deflate_lib = _load_deflate_lib()
+
+# zlib releases the GIL while compressing, so threads deflate members in parallel.
+_DEFLATE_WORKERS = min(32, os.cpu_count() or 1)
+# Level 1 is several times faster than zlib's default 6 for a few percent larger chapters.
+_DEFLATE_LEVEL = 1
+
+
+class ZipArchiveItems(Mapping[str, bytes]):
+    """Lazy, read-only view over the members of an EPUB zip archive.
+
+    Only the central directory is parsed up front; member payloads are decompressed
+    when accessed. The archive stays open so `ZipEpubRepository.save` can copy the
+    compressed records of untouched members straight into the output archive.
+    """
+
+    def __init__(self, source_path: Path) -> None:
+        self.source_path = source_path
+        self._fh = open(source_path, "rb", buffering=_IO_BUFFER_SIZE)  # noqa: SIM115
+        try:
+            self._archive = zipfile.ZipFile(self._fh, "r")
+        except Exception:
+            self._fh.close()
+            raise
+        self._infos = {info.filename: info for info in self._archive.infolist()}
+        self._raw_fp = open(source_path, "rb", buffering=_IO_BUFFER_SIZE)  # noqa: SIM115
+        self._raw_lock = threading.Lock()
+
+    def __getitem__(self, path: str) -> bytes:
+        info = self._infos.get(path)
+        if info is None:
+            raise KeyError(path)
+        return self._archive.read(info)
+
+    def __contains__(self, path: object) -> bool:
+        return path in self._infos
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._infos)
+
+    def __len__(self) -> int:
+        return len(self._infos)
+
+    def info(self, path: str) -> zipfile.ZipInfo:
+        """Return the central-directory entry for one member."""
+        return self._infos[path]
+
+    def compression_types(self) -> dict[str, int]:
+        """Return original ZIP compression constant per member path."""
+        return {path: info.compress_type for path, info in self._infos.items()}
+
+    def raw_member(self, path: str) -> tuple[zipfile.ZipInfo, bytes, bytes]:
+        """Return member info, its still-compressed payload and its local-header extra.
+
+        The local extra field can differ from the central-directory one held by the
+        ZipInfo (timestamps, ZIP64 sizes), so it is returned for the copied local header.
+        """
+        info = self._infos[path]
+        with self._raw_lock:
+            self._raw_fp.seek(info.header_offset)
+            header = self._raw_fp.read(_LOCAL_HEADER.size)
+            if len(header) != _LOCAL_HEADER.size or header[:4] != _LOCAL_HEADER_SIGNATURE:
+                raise zipfile.BadZipFile(f"Bad local file header for member: {path}")
+            fields = _LOCAL_HEADER.unpack(header)
+            name_len, extra_len = fields[-2], fields[-1]
+            self._raw_fp.seek(name_len, 1)
+            local_extra = self._raw_fp.read(extra_len)
+            return info, self._raw_fp.read(info.compress_size), local_extra
+
+    def close(self) -> None:
+        """Close the underlying archive handles; calling it again is a no-op."""
+        self._archive.close()
+        self._fh.close()
+        self._raw_fp.close()
+
+    def __enter__(self) -> ZipArchiveItems:
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+# Newest Python whose zipfile internals `_copy_raw_member` has been verified against.
+_RAW_COPY_MAX_PYTHON = (3, 13)
+_RAW_COPY_INTERNALS = ("_lock", "_writecheck", "_didModify", "start_dir", "fp")
+
+
+def _zipfile_allows_raw_copy() -> bool:
+    """Return True when this interpreter's zipfile has the internals `_copy_raw_member` uses.
+
+    They are private CPython details. On a newer Python, or when any of them is missing,
+    members are written through the public `ZipFile.writestr` instead.
+    """
+    if sys.version_info[:2] > _RAW_COPY_MAX_PYTHON:
+        return False
+    with zipfile.ZipFile(io.BytesIO(), "w") as probe:
+        return all(hasattr(probe, name) for name in _RAW_COPY_INTERNALS)
+
+
+_RAW_COPY_SUPPORTED = _zipfile_allows_raw_copy()
+
+
+def _strip_zip64_extra(extra: bytes) -> bytes:
+    """Return `extra` without ZIP64 fields; copied records are small enough not to need them.
+
+    A ZIP64 field only describes the sizes and offset of the record it came from, which
+    the copy rewrites. A truncated trailing field is kept as-is.
+    """
+    kept: list[bytes] = []
+    pos = 0
+    while pos + _EXTRA_FIELD_HEADER.size <= len(extra):
+        field_id, size = _EXTRA_FIELD_HEADER.unpack_from(extra, pos)
+        end = pos + _EXTRA_FIELD_HEADER.size + size
+        if field_id != _ZIP64_EXTRA_ID:
+            kept.append(extra[pos:end])
+        pos = end
+    kept.append(extra[pos:])
+    return b"".join(kept)
+
+
+def _copy_raw_member(
+    archive: zipfile.ZipFile,
+    info: zipfile.ZipInfo,
+    compressed: bytes,
+    local_extra: bytes = b"",
+) -> None:
+    """Append an already-compressed member to `archive` without inflating/deflating it.
+
+    zipfile has no public API for pre-compressed data, so this follows the same
+    internal sequence `ZipFile.mkdir` uses to append one record. Only called when
+    `_RAW_COPY_SUPPORTED` is True.
+
+    The local header is written with `local_extra` and the central directory keeps the
+    ZipInfo's own extra, both without ZIP64 fields.
+    """
+    zinfo = copy.copy(info)
+    # CRC and sizes are known up front, so the header carries them directly.
+    zinfo.flag_bits &= ~_FLAG_DATA_DESCRIPTOR
+    central_extra = _strip_zip64_extra(info.extra)
+    zinfo.extra = _strip_zip64_extra(local_extra)
+    local_header = zinfo.FileHeader(False)
+    zinfo.extra = central_extra
+    fp = archive.fp
+    assert fp is not None
+    with archive._lock:  # type: ignore[attr-defined]
+        fp.seek(archive.start_dir)
+        zinfo.header_offset = fp.tell()
+        archive._writecheck(zinfo)  # type: ignore[attr-defined]
+        archive._didModify = True  # type: ignore[attr-defined]
+        archive.filelist.append(zinfo)
+        archive.NameToInfo[zinfo.filename] = zinfo
+        fp.write(local_header)
+        fp.write(compressed)
+        archive.start_dir = fp.tell()
+
+
+def _deflate_member(name: str, data: bytes) -> tuple[zipfile.ZipInfo, bytes]:
+    """Raw-deflate one member payload and build the matching ZipInfo record."""
+    compressor = _deflate_lib.compressobj(_DEFLATE_LEVEL, zlib.DEFLATED, -zlib.MAX_WBITS)
+    compressed = compressor.compress(data) + compressor.flush()
+    zinfo = zipfile.ZipInfo(name, date_time=time.localtime(time.time())[:6])
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    zinfo.external_attr = 0o600 << 16
+    zinfo.file_size = len(data)
+    zinfo.compress_size = len(compressed)
+    zinfo.CRC = _deflate_lib.crc32(data)
+    return zinfo, compressed
+
 
 @dataclass(frozen=True)
 class ZipEpubRepository(EpubRepositoryPort):
@@ -20,31 +231,23 @@ class ZipEpubRepository(EpubRepositoryPort):
     Notes:
     - EPUB is a zip container with specific constraints (mimetype must be first and stored).
     - Chapter reading order follows the OPF spine; falls back to lexicographic order.
-    - Per-item compression type is preserved on save so binary assets are not re-compressed.
+    - Items are loaded lazily; only chapters and packaging documents are decompressed.
+    - Untouched members (those without an override) are copied as raw compressed
+      records on save, so binary assets are neither inflated nor re-compressed.
+      Members that do need deflating are compressed in parallel and then appended in
+      archive order.
     """
 
-    @staticmethod
-    def _read_archive_items(
-        input_path: Path,
-    ) -> tuple[dict[str, bytes], dict[str, int]]:
-        """Read every ZIP member from EPUB archive into memory with original compression types."""
-        items: dict[str, bytes] = {}
-        compression_types: dict[str, int] = {}
-        with zipfile.ZipFile(input_path, "r") as archive:
-            for info in archive.infolist():
-                items[info.filename] = archive.read(info.filename)
-                compression_types[info.filename] = info.compress_type
-        return items, compression_types
-
     @staticmethod
     def _is_chapter_resource(resource_path: str) -> bool:
         """Return True when resource path likely contains chapter markup."""
-        return resource_path.lower().endswith((".xhtml", ".html", ".htm"))
+        _, dot, extension = resource_path.rpartition(".")
+        return bool(dot) and "/" not in extension and extension.lower() in _CHAPTER_EXTENSIONS
 
     @classmethod
     def _chapter_documents(
         cls,
-        items: dict[str, bytes],
+        items: Mapping[str, bytes],
     ) -> list[ChapterDocument]:
         """Return chapter documents in OPF spine order, falling back to lexicographic."""
         chapter_paths = {path for path in items if cls._is_chapter_resource(path)}
@@ -71,9 +274,71 @@ class ZipEpubRepository(EpubRepositoryPort):
         )
 
     @staticmethod
-    def _write_archive_items(book: EpubBook, output_path: Path) -> None:
-        """Write EPUB items preserving mimetype ordering and original compression modes."""
-        with zipfile.ZipFile(output_path, "w") as archive:
+    def _raw_copy_source(
+        items: Mapping[str, bytes],
+    ) -> tuple[ZipArchiveItems | None, Mapping[str, bytes]]:
+        """Return the source archive whose members can be copied raw, plus its overrides."""
+        if isinstance(items, ZipArchiveItems):
+            return items, {}
+        if isinstance(items, ItemOverlay) and isinstance(items.base, ZipArchiveItems):
+            return items.base, items.overrides
+        return None, {}
+
+    @staticmethod
+    def _can_copy_raw(info: zipfile.ZipInfo) -> bool:
+        """Return True when a member record can be copied verbatim into a new archive."""
+        return (
+            not info.flag_bits & _FLAG_ENCRYPTED
+            and info.file_size <= _ZIP64_LIMIT
+            and info.compress_size <= _ZIP64_LIMIT
+        )
+
+    @classmethod
+    def _raw_copy_names(
+        cls,
+        source: ZipArchiveItems | None,
+        overrides: Mapping[str, bytes],
+    ) -> set[str]:
+        """Return source members whose compressed records can be copied through unchanged.
+
+        A member is unchanged exactly when the overlay holds no override for it; the
+        orchestrator only overrides chapters it actually rewrote.
+        """
+        if source is None:
+            return set()
+        return {
+            name
+            for name in source
+            if name not in overrides and cls._can_copy_raw(source.info(name))
+        }
+
+    @staticmethod
+    def _write_archive_items(
+        book: EpubBook,
+        output_path: Path,
+        source: ZipArchiveItems | None,
+        raw_names: set[str],
+    ) -> None:
+        """Write EPUB items preserving mimetype ordering and original compression modes.
+
+        Without raw-copy support, every member goes through `writestr`; untouched
+        members keep their source ZipInfo (name, timestamp, compression) either way.
+        """
+        deflate_names = [
+            name
+            for name in book.items
+            if _RAW_COPY_SUPPORTED
+            and name != "mimetype"
+            and name not in raw_names
+            and book.compression_types.get(name, zipfile.ZIP_DEFLATED) == zipfile.ZIP_DEFLATED
+        ]
+        with ExitStack() as stack:
+            pool = stack.enter_context(ThreadPoolExecutor(max_workers=_DEFLATE_WORKERS))
+            fh = stack.enter_context(open(output_path, "wb", buffering=_IO_BUFFER_SIZE))
+            archive = stack.enter_context(zipfile.ZipFile(fh, "w"))
+            deflated: dict[str, Future[tuple[zipfile.ZipInfo, bytes]]] = {
+                name: pool.submit(_deflate_member, name, book.items[name]) for name in deflate_names
+            }
             if "mimetype" in book.items:
                 archive.writestr(
                     "mimetype",
@@ -81,16 +346,36 @@ class ZipEpubRepository(EpubRepositoryPort):
                     compress_type=zipfile.ZIP_STORED,
                 )
 
-            for name, content in book.items.items():
+            for name in book.items:
                 if name == "mimetype":
                     continue
+                if source is not None and name in raw_names:
+                    if _RAW_COPY_SUPPORTED:
+                        _copy_raw_member(archive, *source.raw_member(name))
+                    else:
+                        archive.writestr(copy.copy(source.info(name)), source[name])
+                    continue
+                if name in deflated:
+                    _copy_raw_member(archive, *deflated[name].result())
+                    continue
                 compress_type = book.compression_types.get(name, zipfile.ZIP_DEFLATED)
-                archive.writestr(name, content, compress_type=compress_type)
+                archive.writestr(name, book.items[name], compress_type=compress_type)
+
+    @staticmethod
+    def _clone_archive(source_path: Path, output_path: Path, temp_path: Path) -> bool:
+        """Copy the unchanged source archive to `temp_path`; `copyfile` uses sendfile on Linux.
+
+        Returns False when the output already is the source file and nothing was copied.
+        """
+        if output_path.exists() and output_path.samefile(source_path):
+            return False
+        shutil.copyfile(source_path, temp_path)
+        return True
 
     def load(self, input_path: Path) -> EpubBook:
-        """Load EPUB archive and return chapter-aware in-memory representation."""
+        """Load EPUB archive and return chapter-aware representation with lazy items."""
         try:
-            items, compression_types = self._read_archive_items(input_path)
+            items = ZipArchiveItems(input_path)
         except Exception as exc:  # noqa: BLE001
             raise EpubReadError(str(exc)) from exc
 
@@ -101,13 +386,45 @@ class ZipEpubRepository(EpubRepositoryPort):
             len(items),
             len(chapters),
         )
-        return EpubBook(items=items, chapters=chapters, compression_types=compression_types)
+        return EpubBook(
+            items=items,
+            chapters=chapters,
+            compression_types=items.compression_types(),
+        )
+
+    def close(self, book: EpubBook) -> None:
+        """Release the source archive handles held by a loaded book's lazy items."""
+        source, _ = self._raw_copy_source(book.items)
+        if source is not None:
+            source.close()
 
     def save(self, book: EpubBook, output_path: Path) -> None:
-        """Persist in-memory EPUB book representation to archive file."""
+        """Persist EPUB book representation to archive file.
+
+        Output goes to a sibling temp file first, so in-place runs (input == output)
+        can keep streaming untouched members from the original archive. When no member
+        changed, the source archive is copied as a whole file instead (or left alone
+        when writing in place). The source archive is closed once the output is written,
+        so the book's items cannot be read after saving.
+        """
+        source, overrides = self._raw_copy_source(book.items)
+        raw_names = self._raw_copy_names(source, overrides)
+        temp_path = output_path.with_suffix(output_path.suffix + ".tmp")
         try:
-            self._write_archive_items(book, output_path)
+            if source is not None and len(raw_names) == len(book.items):
+                logger.debug("EPUB unchanged — copying source archive | path=%s", output_path)
+                written = self._clone_archive(source.source_path, output_path, temp_path)
+            else:
+                self._write_archive_items(book, temp_path, source, raw_names)
+                written = True
+            if source is not None:
+                # In-place output replaces the source file, and Windows refuses to replace
+                # a file that still has open handles.
+                source.close()
+            if written:
+                temp_path.replace(output_path)
         except Exception as exc:  # noqa: BLE001
+            temp_path.unlink(missing_ok=True)
             raise EpubWriteError(str(exc)) from exc
 
         logger.debug(
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import posixpath
+from collections.abc import Mapping
 
 from lxml import etree
 
@@ -10,21 +11,28 @@ logger = create_logger(__name__)
 
 _CONTAINER_PATH = "META-INF/container.xml"
 
+# `{*}` matches the local name in any namespace or none, like XPath `local-name()`, but
+# the filter runs inside lxml's tree iterator instead of an XPath predicate per element.
+_ROOTFILE_TAG = "{*}rootfile"
+_ITEM_TAG = "{*}item"
+_ITEMREF_TAG = "{*}itemref"
+
 
 class OPFSpineParser:
     """Parses EPUB OPF package documents to determine spine-ordered chapter paths."""
 
     @staticmethod
-    def find_opf_path(items: dict[str, bytes]) -> str | None:
+    def find_opf_path(items: Mapping[str, bytes]) -> str | None:
         """Return the OPF rootfile path from META-INF/container.xml, or None."""
         container_bytes = items.get(_CONTAINER_PATH)
         if not container_bytes:
             return None
         try:
             root = etree.fromstring(container_bytes)
-            results = root.xpath("//*[local-name()='rootfile']/@full-path")
-            if isinstance(results, list) and results and isinstance(results[0], str):
-                return results[0]
+            for rootfile in root.iter(_ROOTFILE_TAG):
+                full_path = rootfile.get("full-path")
+                if full_path is not None:
+                    return full_path
         except etree.XMLSyntaxError:
             logger.warning("Failed to parse META-INF/container.xml")
         return None
@@ -51,17 +59,13 @@ class OPFSpineParser:
 
         # Build manifest: id -> resolved archive path
         manifest: dict[str, str] = {}
-        item_results = root.xpath("//*[local-name()='item']")
-        if isinstance(item_results, list):
-            for item in item_results:
-                if not isinstance(item, etree._Element):
-                    continue
-                item_id = item.get("id")
-                href = item.get("href")
-                if not item_id or not href:
-                    continue
-                resolved = posixpath.normpath(posixpath.join(opf_dir, href)) if opf_dir else href
-                manifest[item_id] = resolved
+        for item in root.iter(_ITEM_TAG):
+            item_id = item.get("id")
+            href = item.get("href")
+            if not item_id or not href:
+                continue
+            resolved = posixpath.normpath(posixpath.join(opf_dir, href)) if opf_dir else href
+            manifest[item_id] = resolved
 
         if not manifest:
             logger.warning("OPF manifest is empty | path=%s", opf_path)
@@ -69,17 +73,13 @@ class OPFSpineParser:
 
         # Walk spine itemrefs in order
         ordered: list[str] = []
-        itemref_results = root.xpath("//*[local-name()='itemref']")
-        if isinstance(itemref_results, list):
-            for itemref in itemref_results:
-                if not isinstance(itemref, etree._Element):
-                    continue
-                idref = itemref.get("idref")
-                if not idref or idref not in manifest:
-                    continue
-                resolved_path = manifest[idref]
-                if resolved_path in all_paths:
-                    ordered.append(resolved_path)
+        for itemref in root.iter(_ITEMREF_TAG):
+            idref = itemref.get("idref")
+            if not idref or idref not in manifest:
+                continue
+            resolved_path = manifest[idref]
+            if resolved_path in all_paths:
+                ordered.append(resolved_path)
 
         if not ordered:
             logger.warning("OPF spine yielded no known chapter paths | path=%s", opf_path)
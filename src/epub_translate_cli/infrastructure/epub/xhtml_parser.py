@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import random
 import re
+import threading
+from bisect import bisect_left
 from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass
-from typing import cast
+from functools import lru_cache
+from itertools import chain
 
 from lxml import etree
 
@@ -23,9 +28,17 @@ CHAPTER_CONTEXT_MAX_CHARS: int = 1500
 REPORT_FIELD_MAX_CHARS: int = 200
 BACKOFF_CAP_SECONDS: float = 4.0
 BACKOFF_BASE: float = 0.25
-
-# Regex to strip ``<<<`` / ``>>>`` fence markers the model might echo.
-_FENCE_RE = re.compile(r"^<<<\s*|\s*>>>$")
+# Upper bound on a provider-requested Retry-After delay.
+RETRY_AFTER_CAP_SECONDS: float = 30.0
+# Rough UTF-8 bytes-per-token ratio used to estimate prompt cost without a tokenizer.
+BYTES_PER_TOKEN_ESTIMATE: int = 4
+
+# Word-boundary scans used when splitting translations across inline text slots.
+_WHITESPACE_RE = re.compile(r"\s")
+_LAST_WHITESPACE_RE = re.compile(r".*\s", re.DOTALL)
+# Sentence boundaries used when trimming rolling context to the token budget.
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?…])[\"'”’»)]*\s+")
+_WORD_SCAN_WINDOW = 32
 
 # Common HTML named entities often found in EPUB XHTML that are not predefined XML entities.
 _HTML_ENTITY_TO_NUMERIC: dict[bytes, bytes] = {
@@ -38,28 +51,74 @@ _HTML_ENTITY_TO_NUMERIC: dict[bytes, bytes] = {
     b"&rdquo;": b"&#8221;",
     b"&hellip;": b"&#8230;",
 }
+# One-pass matcher for the entities above; a chapter without any of them is returned as-is.
+_HTML_ENTITY_RE = re.compile(b"|".join(re.escape(entity) for entity in _HTML_ENTITY_TO_NUMERIC))
+
+XHTML_NS = "http://www.w3.org/1999/xhtml"
 
 _CONTENT_ONLY_TYPES = (etree._Entity, etree._Comment, etree._ProcessingInstruction)
 _TRANSLATABLE_TAG_SET = frozenset(DEFAULT_TRANSLATABLE_TAGS)
 
-_PROTECTED_ANCESTORS: dict[str, SkipReason] = {
+# Local tag names that exclude a node from translation when found around or inside it.
+_PROTECTED_TAGS: dict[str, SkipReason] = {
     "code": "protected_code",
     "pre": "protected_code",
+    "style": "protected_metadata",
+    "script": "protected_metadata",
 }
+# Only checked on the node itself and its ancestors.
+_METADATA_ANCESTOR_TAGS = frozenset({"head", "title"})
+
+
+# lxml parsers must not be shared across threads; each chapter worker keeps its own.
+_thread_parsers = threading.local()
 
-_ws_re = re.compile(r"\s+")
+
+def _chapter_parser() -> etree.XMLParser:
+    """Return this thread's reusable chapter parser, creating it on first use."""
+    parser: etree.XMLParser | None = getattr(_thread_parsers, "parser", None)
+    if parser is None:
+        parser = etree.XMLParser(recover=True, resolve_entities=True)
+        _thread_parsers.parser = parser
+    return parser
 
 
 def _normalize_non_xml_entities(xhtml_bytes: bytes) -> bytes:
-    normalized = xhtml_bytes
-    for src, dst in _HTML_ENTITY_TO_NUMERIC.items():
-        normalized = normalized.replace(src, dst)
-    return normalized
+    return _HTML_ENTITY_RE.sub(lambda match: _HTML_ENTITY_TO_NUMERIC[match[0]], xhtml_bytes)
+
+
+def _element_tags(*local_names: str) -> tuple[str, ...]:
+    """Return tag filters matching each local name in the XHTML namespace and in no namespace.
+
+    lxml matches these filters against interned tag names, which is much cheaper than
+    evaluating XPath `local-name()` on every element.
+    """
+    return tuple(tag for name in local_names for tag in (f"{{{XHTML_NS}}}{name}", name))
+
+
+_PARAGRAPH_TAGS = _element_tags("p")
+
+
+_ANCESTOR_SKIP_REASONS_BY_NAME: dict[str, SkipReason] = {
+    **_PROTECTED_TAGS,
+    **dict.fromkeys(_METADATA_ANCESTOR_TAGS, "protected_metadata"),
+}
+
 
+@lru_cache(maxsize=1024)
+def _descendant_tag_skip_reason(tag: str) -> SkipReason | None:
+    """Return the reason a protected descendant with raw `tag` gives, in any namespace or case.
+
+    Memoized per raw tag: a chapter uses a handful of distinct tags, so QName parsing runs
+    once per spelling rather than once per element.
+    """
+    return _PROTECTED_TAGS.get(etree.QName(tag).localname.lower())
 
-def _translatable_xpath(tags: tuple[TranslatableTag, ...]) -> str:
-    predicates = " or ".join(f"local-name()='{tag}'" for tag in tags)
-    return f"//*[{predicates}]"
+
+@lru_cache(maxsize=1024)
+def _ancestor_tag_skip_reason(tag: str) -> SkipReason | None:
+    """Return the reason an element with raw `tag` gives itself and its descendants."""
+    return _ANCESTOR_SKIP_REASONS_BY_NAME.get(etree.QName(tag).localname.lower())
 
 
 def _is_writable_element(node: etree._Element) -> bool:
@@ -100,25 +159,44 @@ def distribute_text(translated: str, slot_lengths: list[int]) -> list[str]:
     if total_orig == 0:
         return [translated] + [""] * (len(slot_lengths) - 1)
 
+    # Whitespace offsets are indexed once; each slot cut is then a bisect on absolute
+    # positions instead of a rescan of the shrinking remainder.
+    spaces = [match.start() for match in _WHITESPACE_RE.finditer(translated)]
+    end = len(translated)
     result: list[str] = []
-    remaining = translated
+    base = 0
     remaining_weight = total_orig
 
     for weight in slot_lengths[:-1]:
-        if not remaining:
+        if base >= end:
             result.append("")
             continue
-        ideal = round(len(remaining) * weight / remaining_weight)
-        ideal = max(0, min(ideal, len(remaining)))
-        split_pos = nearest_word_boundary(remaining, ideal)
-        result.append(remaining[:split_pos])
-        remaining = remaining[split_pos:]
+        ideal = round((end - base) * weight / remaining_weight)
+        ideal = max(0, min(ideal, end - base))
+        split_pos = _indexed_word_boundary(spaces, base, end, base + ideal)
+        result.append(translated[base:split_pos])
+        base = split_pos
         remaining_weight -= weight
 
-    result.append(remaining)
+    result.append(translated[base:])
     return result
 
 
+def _indexed_word_boundary(spaces: list[int], base: int, end: int, pos: int) -> int:
+    """Return ``nearest_word_boundary`` of ``text[base:end]`` as an absolute offset.
+
+    ``spaces`` holds the sorted offsets of every whitespace character in the text.
+    """
+    if pos >= end:
+        return end
+    if pos == base:
+        return base
+    after = bisect_left(spaces, pos)
+    forward = spaces[after] if after < len(spaces) else end
+    backward = spaces[after - 1] if after > 0 and spaces[after - 1] > base else base
+    return forward if (forward - pos) <= (pos - backward) else backward + 1
+
+
 def nearest_word_boundary(text: str, pos: int) -> int:
     """Return the nearest split position around ``pos`` that avoids breaking words."""
     if pos >= len(text):
@@ -126,34 +204,42 @@ def nearest_word_boundary(text: str, pos: int) -> int:
     if pos == 0:
         return 0
 
-    forward = pos
-    while forward < len(text) and not text[forward].isspace():
-        forward += 1
+    # Both scans run inside the regex engine instead of a per-character Python loop.
+    next_space = _WHITESPACE_RE.search(text, pos)
+    forward = next_space.start() if next_space is not None else len(text)
 
-    backward = pos - 1
-    while backward > 0 and not text[backward].isspace():
-        backward -= 1
+    # Greedy `.*\s` over text[start:pos] ends on the last whitespace before pos. Words
+    # are short, so try a small window first; index 0 is the floor when there is none.
+    window_start = max(1, pos - _WORD_SCAN_WINDOW)
+    last_space = _LAST_WHITESPACE_RE.match(text, window_start, pos)
+    if last_space is None and window_start > 1:
+        last_space = _LAST_WHITESPACE_RE.match(text, 1, window_start)
+    backward = last_space.end() - 1 if last_space is not None else 0
 
     return forward if (forward - pos) <= (pos - backward) else backward + 1
 
 
-def skip_reason(elem: etree._Element) -> SkipReason | None:
-    """Return skip reason for protected elements, metadata areas, or embedded code."""
-    for anc in [elem, *elem.iterancestors()]:
-        tag = etree.QName(anc.tag).localname.lower() if isinstance(anc.tag, str) else ""
-        if tag in _PROTECTED_ANCESTORS:
-            return _PROTECTED_ANCESTORS[tag]
-        if tag in ("head", "title", "style", "script"):
-            return "protected_metadata"
+def skip_reason(
+    elem: etree._Element,
+    ancestor_cache: dict[etree._Element, SkipReason | None] | None = None,
+) -> SkipReason | None:
+    """Return skip reason for protected elements, metadata areas, or embedded code.
 
-    for descendant in elem.iterdescendants():
-        d_tag = (
-            etree.QName(descendant.tag).localname.lower() if isinstance(descendant.tag, str) else ""
-        )
-        if d_tag in ("code", "pre"):
-            return "protected_code"
-        if d_tag in ("style", "script"):
-            return "protected_metadata"
+    Paragraphs of one chapter share most of their ancestry, so callers classifying a
+    whole tree may pass an `ancestor_cache`: each element walked records the reason
+    inherited from its nearest protected ancestor, and later walks stop at the first
+    element already recorded.
+    """
+    reason = _ancestor_skip_reason(elem, ancestor_cache)
+    if reason is not None:
+        return reason
+
+    # The first protected descendant in document order decides the reason. Filtering on
+    # etree.Element skips comments and processing instructions, whose tags are not names.
+    for desc in elem.iterdescendants(etree.Element):
+        reason = _descendant_tag_skip_reason(desc.tag)
+        if reason is not None:
+            return reason
 
     return None
 
@@ -162,25 +248,153 @@ def skip_reason(elem: etree._Element) -> SkipReason | None:
 _skip_reason = skip_reason
 
 
+def skip_reasons(
+    root: etree._Element, elements: Iterable[etree._Element]
+) -> list[SkipReason | None]:
+    """Return `skip_reason` for each element of one chapter tree, in input order.
+
+    Protected descendants are resolved in one pass over the tree: each protected element
+    marks its ancestors with its reason, first in document order winning. Prose chapters
+    usually contain none, so the per-element check becomes a dict lookup instead of a
+    subtree scan; ancestry lookups share one cache.
+    """
+    below: dict[etree._Element, SkipReason] = {}
+    for protected in root.iter(etree.Element):
+        reason = _descendant_tag_skip_reason(protected.tag)
+        if reason is None:
+            continue
+        for anc in protected.iterancestors():
+            if anc in below:
+                # An earlier protected element already marked this chain up to the root.
+                break
+            below[anc] = reason
+
+    ancestor_cache: dict[etree._Element, SkipReason | None] = {}
+    return [_ancestor_skip_reason(elem, ancestor_cache) or below.get(elem) for elem in elements]
+
+
+def _ancestor_skip_reason(
+    elem: etree._Element,
+    cache: dict[etree._Element, SkipReason | None] | None,
+) -> SkipReason | None:
+    """Return the reason of the nearest protected element among `elem` and its ancestors."""
+    walked: list[etree._Element] = []
+    reason: SkipReason | None = None
+    for anc in chain((elem,), elem.iterancestors()):
+        if cache is not None and anc in cache:
+            reason = cache[anc]
+            break
+        walked.append(anc)
+        reason = _ancestor_tag_skip_reason(anc.tag)
+        if reason is not None:
+            break
+    if cache is not None:
+        # Keys hold the lxml proxies alive, so element identity stays stable for the
+        # lifetime of the cache.
+        for anc in walked:
+            cache[anc] = reason
+    return reason
+
+
+def _element_text(elem: etree._Element) -> str:
+    """Return the concatenated descendant text of `elem`, excluding its own tail.
+
+    The text serializer joins the text nodes inside libxml2 rather than through a Python
+    generator over `itertext()`; with entities resolved at parse time both agree.
+    """
+    return str(etree.tostring(elem, method="text", encoding="unicode", with_tail=False))
+
+
 def _limit(text: str, max_len: int) -> str:
     """Normalize whitespace and truncate text for compact reporting fields."""
-    cleaned = _ws_re.sub(" ", text).strip()
+    # str.split() splits on exactly the characters `\s` matches, so this equals the
+    # regex collapse-and-strip at C speed.
+    if len(text) > 2 * max_len:
+        # Long paragraphs only contribute their opening words. Collapsing a raw prefix
+        # yields the same leading characters as collapsing the whole text, so once that
+        # prefix alone overflows, the rest of the paragraph is never split.
+        head = " ".join(text[: 2 * max_len].split())
+        if len(head) > max_len:
+            return head[: max_len - 1] + "…"
+    cleaned = " ".join(text.split())
     if len(cleaned) <= max_len:
         return cleaned
     return cleaned[: max_len - 1] + "…"
 
 
-def _backoff_seconds(attempt: int) -> float:
-    """Compute exponential retry backoff capped at BACKOFF_CAP_SECONDS."""
+def strip_fences(text: str) -> str:
+    """Strip `<<<` / `>>>` fence markers echoed by the model, plus surrounding whitespace."""
+    stripped = text.strip()
+    if stripped.startswith("<<<"):
+        stripped = stripped[3:].lstrip()
+    if stripped.endswith(">>>"):
+        stripped = stripped[:-3].rstrip()
+    return stripped
+
+
+def _backoff_seconds(attempt: int, hint: float | None = None) -> float:
+    """Compute retry delay: the provider's hint when given, else jittered exponential backoff.
+
+    Full jitter (a uniform draw below the capped exponential) keeps concurrent workers
+    from retrying in lockstep against the same server.
+    """
+    if hint is not None:
+        return max(0.0, min(hint, RETRY_AFTER_CAP_SECONDS))
     delay = BACKOFF_BASE * (2**attempt)
-    return BACKOFF_CAP_SECONDS if delay > BACKOFF_CAP_SECONDS else delay
+    return random.uniform(0.0, BACKOFF_CAP_SECONDS if delay > BACKOFF_CAP_SECONDS else delay)
+
+
+def _estimated_tokens(text: str) -> int:
+    return len(text.encode("utf-8")) // BYTES_PER_TOKEN_ESTIMATE
+
 
+def _prior_block(source: str, translation: str) -> str:
+    return f"Original: {source}\nTranslation: {translation}"
 
-def _format_prior_pairs(window: deque[tuple[str, str]], context_size: int) -> str:
-    """Format rolling source→target pairs for prior-translations context block."""
+
+def _trailing_sentences_block(source: str, translation: str, token_budget: int) -> str:
+    """Format the most sentences from the end of one pair that fit `token_budget`.
+
+    Both sides keep the same number of trailing sentences. The last sentence pair is
+    kept even when it alone exceeds the budget, so recent context is never dropped.
+    """
+    source_sentences = _SENTENCE_BREAK_RE.split(source.strip())
+    translation_sentences = _SENTENCE_BREAK_RE.split(translation.strip())
+    for count in range(max(len(source_sentences), len(translation_sentences)) - 1, 0, -1):
+        block = _prior_block(
+            " ".join(source_sentences[-count:]), " ".join(translation_sentences[-count:])
+        )
+        if _estimated_tokens(block) <= token_budget:
+            return block
+    return _prior_block(source_sentences[-1], translation_sentences[-1])
+
+
+def _format_prior_pairs(
+    window: deque[tuple[str, str]],
+    context_size: int,
+    token_budget: int = 0,
+) -> str:
+    """Format rolling source→target pairs for prior-translations context block.
+
+    With a positive `token_budget`, only the most recent pairs whose estimated token
+    count fits the budget are kept, capping the prompt prefill cost. A newest pair that
+    alone exceeds the budget is trimmed to its trailing sentences instead of dropped.
+    """
     if context_size <= 0 or not window:
         return ""
-    return "\n\n".join(f"Original: {src}\nTranslation: {tgt}" for src, tgt in window)
+    if token_budget <= 0:
+        return "\n\n".join(_prior_block(src, tgt) for src, tgt in window)
+    kept: list[str] = []
+    used = 0
+    for src, tgt in reversed(window):
+        block = _prior_block(src, tgt)
+        used += _estimated_tokens(block)
+        if used > token_budget:
+            if not kept:
+                kept.append(_trailing_sentences_block(src, tgt, token_budget))
+            break
+        kept.append(block)
+    return "\n\n".join(reversed(kept))
 
 
 @dataclass(frozen=True)
@@ -205,18 +419,26 @@ class XHTMLTranslator:
     @staticmethod
     def serialize_chapter(root: etree._Element) -> bytes:
         """Serialize lxml element tree back to XHTML bytes."""
-        result: bytes = etree.tostring(root, encoding="utf-8", xml_declaration=True)
+        result: bytes = etree.tostring(
+            root, encoding="utf-8", xml_declaration=True, pretty_print=False
+        )
         return result
 
     @staticmethod
     def chapter_context(root: etree._Element) -> str:
         """Build representative chapter context from start, middle, and end paragraphs."""
-        raw = root.xpath("//*[local-name()='p']")
-        para_elems = (
-            [e for e in raw if isinstance(e, etree._Element)] if isinstance(raw, list) else []
+        return XHTMLTranslator.paragraph_context(
+            _element_text(e).strip() for e in root.iter(*_PARAGRAPH_TAGS)
         )
-        para_texts = ["".join(str(t) for t in e.itertext()).strip() for e in para_elems]
-        para_texts = [t for t in para_texts if t]
+
+    @staticmethod
+    def paragraph_context(paragraph_texts: Iterable[str]) -> str:
+        """Build chapter context from already-extracted paragraph texts in document order.
+
+        Lets callers that collected candidate nodes reuse their text instead of walking
+        the tree a second time.
+        """
+        para_texts = [t for t in paragraph_texts if t]
 
         if not para_texts:
             return ""
@@ -238,43 +460,103 @@ class XHTMLTranslator:
 
     @staticmethod
     def _parse_root(xhtml_bytes: bytes) -> etree._Element:
-        parser = etree.XMLParser(recover=True, resolve_entities=True)
         normalized_xhtml = _normalize_non_xml_entities(xhtml_bytes)
-        return etree.fromstring(normalized_xhtml, parser=parser)
+        return etree.fromstring(normalized_xhtml, parser=_chapter_parser())
 
     def _candidate_nodes(
         self,
         root: etree._Element,
         chapter_path: str,
     ) -> list[tuple[etree._Element, TranslatableNode]]:
-        xpath = _translatable_xpath(self.translatable_tags)
-        raw_nodes = root.xpath(xpath)
-        if not isinstance(raw_nodes, list):
-            return []
-
-        def _to_node(elem: etree._Element) -> tuple[etree._Element, TranslatableNode] | None:
-            if not isinstance(elem.tag, str):
-                return None
-            local_tag = etree.QName(elem.tag).localname.lower()
-            if local_tag not in _TRANSLATABLE_TAG_SET:
-                return None
+        get_path = _ElementPaths()
+        # Raw tag spelling -> translatable local name, so no QName is built per element.
+        local_tags: dict[str, TranslatableTag] = {
+            tag: name
+            for name in self.translatable_tags
+            if name in _TRANSLATABLE_TAG_SET
+            for tag in _element_tags(name)
+        }
+
+        def _to_node(elem: etree._Element) -> tuple[etree._Element, TranslatableNode]:
             node = TranslatableNode(
                 chapter_path=chapter_path,
-                node_path=root.getroottree().getpath(elem),
-                tag=cast(TranslatableTag, local_tag),
-                source_text="".join(str(text) for text in elem.itertext()).strip(),
+                node_path=get_path(elem),
+                tag=local_tags[elem.tag],
+                source_text=_element_text(elem).strip(),
             )
             return elem, node
 
-        return [
-            item
-            for item in (_to_node(elem) for elem in raw_nodes if isinstance(elem, etree._Element))
-            if item is not None
-        ]
+        return [_to_node(elem) for elem in root.iter(*local_tags)]
+
+
+class _ElementPaths:
+    """Build `ElementTree.getpath()` strings for many elements of one tree in linear time.
+
+    libxml2 recomputes every step of a path by scanning the element's preceding
+    siblings, which is quadratic over a long flat `<body>`. Here each parent's
+    children are numbered once and every path extends its cached parent path. The
+    steps follow libxml2's rules: default-namespace elements are `*` numbered among all
+    element siblings, others are numbered among siblings with the same name and prefix,
+    and the index is omitted when no sibling shares the step.
+    """
+
+    def __init__(self) -> None:
+        self._paths: dict[etree._Element, str] = {}
+
+    def __call__(self, elem: etree._Element) -> str:
+        path = self._paths.get(elem)
+        if path is not None:
+            return path
+        chain = [elem]
+        parent = elem.getparent()
+        while parent is not None and parent not in self._paths:
+            chain.append(parent)
+            parent = parent.getparent()
+        if parent is None:
+            top = chain.pop()
+            self._paths[top] = "/" + _path_step_name(top)
+        for child in reversed(chain):
+            parent = child.getparent()
+            assert parent is not None  # only the top of the chain can be parentless
+            self._number_children(parent)
+        return self._paths[elem]
+
+    def _number_children(self, parent: etree._Element) -> None:
+        """Record paths for all element children of `parent`, whose path is known."""
+        parent_path = self._paths[parent]
+        children = [child for child in parent if isinstance(child.tag, str)]
+        totals: dict[str, int] = {}
+        for child in children:
+            name = _path_step_name(child)
+            totals[name] = totals.get(name, 0) + 1
+        seen: dict[str, int] = {}
+        for position, child in enumerate(children, start=1):
+            name = _path_step_name(child)
+            if name == "*":
+                index, shared = position, len(children) > 1
+            else:
+                index = seen[name] = seen.get(name, 0) + 1
+                shared = totals[name] > 1
+            step = f"{name}[{index}]" if shared else name
+            self._paths[child] = f"{parent_path}/{step}"
+
+
+def _path_step_name(elem: etree._Element) -> str:
+    """Return the libxml2 path step name: `*`, `prefix:local`, or the bare tag."""
+    tag = str(elem.tag)
+    if not tag.startswith("{"):
+        return tag
+    prefix = elem.prefix
+    return "*" if prefix is None else f"{prefix}:{tag[tag.index('}') + 1 :]}"
 
 
 def _replace_element_text(elem: etree._Element, translated: str) -> None:
     """Replace node text while preserving inline markup ownership of text slots."""
+    if not len(elem):
+        # Plain `<p>text</p>`, the common case: the only slot is the element's own text.
+        elem.text = translated
+        return
+
     slots = collect_text_slots(elem)
 
     if not slots:
@@ -287,10 +569,9 @@ def _replace_element_text(elem: etree._Element, translated: str) -> None:
     for (owner, attr), chunk in zip(slots, chunks):
         setattr(owner, attr, chunk)
 
+    # lxml has no `short_empty_elements` switch, so an empty text slot is what keeps
+    # `<span></span>` from collapsing to `<span/>`, which some EPUB readers mis-render.
+    # Only childless elements can self-close, and tails never affect tag syntax.
     for child in elem:
-        if not _is_writable_element(child):
-            continue
-        if child.text is None:
+        if child.text is None and not len(child) and _is_writable_element(child):
             child.text = ""
-        if child.tail is None:
-            child.tail = ""
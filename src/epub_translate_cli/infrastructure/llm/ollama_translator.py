@@ -1,18 +1,27 @@
 from __future__ import annotations
 
 import json
+import logging
 import re
+from collections.abc import Sequence
 from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 
 import requests
+from requests.adapters import HTTPAdapter
 
-from epub_translate_cli.domain.errors import NonRetryableTranslationError, RetryableTranslationError
+from epub_translate_cli.domain.errors import (
+    NonRetryableTranslationError,
+    PartialBatchTranslationError,
+    RetryableTranslationError,
+)
 from epub_translate_cli.domain.models import (
     TranslationRequest,
     TranslationResponse,
     TranslationSettings,
 )
-from epub_translate_cli.domain.ports import PromptBuilderPort, TranslatorPort
+from epub_translate_cli.domain.ports import BatchTranslatorPort, PromptBuilderPort
 from epub_translate_cli.infrastructure.llm.prompt_builder import PromptBuilder
 from epub_translate_cli.infrastructure.logging.logger_factory import create_logger
 
@@ -24,26 +33,40 @@ MAX_TRANSLATION_LEN_RATIO = 3.0
 # Naive HTML-tag injection detector: "<" followed by a word character.
 _HTML_TAG_RE = re.compile(r"<\w")
 
-# Matches when the model echoes back prompt markers from the user message.
-# Covers the current English-only prompt labels and the <<<...>>> fence pattern.
+# Prompt labels from the user message that a model may echo back (matched case-insensitively).
+_LEAKED_PROMPT_MARKERS = ("TEXT TO TRANSLATE", "CHAPTER CONTEXT")
+# Regex fallback for text whose upper-case form changes length (e.g. "ß" -> "SS").
 _LEAKED_PROMPT_RE = re.compile(
     r"^.*(?:TEXT TO TRANSLATE|CHAPTER CONTEXT)\s*(?::\s*)?",
     re.IGNORECASE | re.DOTALL,
 )
 
-# Matches when the model echoes back the full fence-delimited text block
-# (i.e., reproduces the "<<<\n...\n>>>" block from the user prompt).
-_FENCE_ECHO_RE = re.compile(r"^.*>>>\s*", re.DOTALL)
+# Start of one paragraph in a batch reply: the `[[n]]` marker at the beginning of a line.
+_BATCH_MARKER_RE = re.compile(r"^\s*\[\[(\d+)\]\][ \t]*", re.MULTILINE)
+
+
+# Pooled keep-alive connections per host; sized for chapter workers times paragraph lookahead.
+HTTP_POOL_SIZE = 32
+
+
+def _pooled_session() -> requests.Session:
+    """Return a session that reuses keep-alive connections across chat requests."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
 
 
 @dataclass(frozen=True)
-class OllamaTranslator(TranslatorPort):
+class OllamaTranslator(BatchTranslatorPort):
     """Translator adapter that calls Ollama /api/chat with system/user role split."""
 
     settings: TranslationSettings
     base_url: str = "http://localhost:11434"
     timeout_s: float = -1.0
     prompt_builder: PromptBuilderPort = field(default_factory=PromptBuilder)
+    session: requests.Session = field(default_factory=_pooled_session, repr=False, compare=False)
 
     @staticmethod
     def _chat_url(base_url: str) -> str:
@@ -52,6 +75,10 @@ class OllamaTranslator(TranslatorPort):
 
     def _chat_payload(self, request: TranslationRequest) -> dict[str, object]:
         """Build Ollama /api/chat request payload."""
+        return self._messages_payload(self.prompt_builder.build_user_prompt(request))
+
+    def _messages_payload(self, user_prompt: str) -> dict[str, object]:
+        """Build Ollama /api/chat payload from the shared system prompt and one user prompt."""
         return {
             "model": self.settings.model,
             "messages": [
@@ -61,7 +88,7 @@ class OllamaTranslator(TranslatorPort):
                 },
                 {
                     "role": "user",
-                    "content": self.prompt_builder.build_user_prompt(request),
+                    "content": user_prompt,
                 },
             ],
             "stream": False,
@@ -69,9 +96,13 @@ class OllamaTranslator(TranslatorPort):
         }
 
     def _post_chat(self, payload: dict[str, object]) -> requests.Response:
-        """Send HTTP request to Ollama /api/chat and map transport errors to retryable ones."""
+        """Send HTTP request to Ollama /api/chat and map transport errors to retryable ones.
+
+        Requests share the translator's pooled session, so consecutive paragraphs reuse
+        an open connection instead of paying a new TCP (and TLS) handshake each.
+        """
         try:
-            return requests.post(
+            return self.session.post(
                 self._chat_url(self.base_url),
                 json=payload,
                 timeout=None if self.timeout_s < 0 else self.timeout_s,
@@ -82,8 +113,15 @@ class OllamaTranslator(TranslatorPort):
     @staticmethod
     def _validate_response_status(resp: requests.Response) -> None:
         """Validate HTTP status code and raise mapped domain errors."""
+        if resp.status_code == 429:
+            raise RetryableTranslationError(
+                "Ollama rate limit: 429", retry_after=_retry_after_seconds(resp)
+            )
         if resp.status_code >= 500:
-            raise RetryableTranslationError(f"Ollama server error: {resp.status_code}")
+            raise RetryableTranslationError(
+                f"Ollama server error: {resp.status_code}",
+                retry_after=_retry_after_seconds(resp),
+            )
         if resp.status_code >= 400:
             raise NonRetryableTranslationError(
                 f"Ollama request failed: {resp.status_code} {resp.text}"
@@ -113,13 +151,15 @@ class OllamaTranslator(TranslatorPort):
 
     def translate(self, request: TranslationRequest) -> TranslationResponse:
         """Translate one request via Ollama /api/chat and return sanitized translated text."""
-        logger.debug(
-            "Calling Ollama | model=%s source=%s target=%s text_len=%s",
-            self.settings.model,
-            self.settings.source_lang,
-            self.settings.target_lang,
-            len(request.text),
-        )
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug(
+                "Calling Ollama | model=%s source=%s target=%s text_len=%s",
+                self.settings.model,
+                self.settings.source_lang,
+                self.settings.target_lang,
+                len(request.text),
+            )
 
         response = self._post_chat(self._chat_payload(request))
         self._validate_response_status(response)
@@ -127,27 +167,123 @@ class OllamaTranslator(TranslatorPort):
         raw_text = self._response_text(payload)
         clean_text = _sanitise_response(raw_text, request.text)
 
-        logger.debug(
-            "Ollama response received | raw_len=%s clean_len=%s",
-            len(raw_text),
-            len(clean_text),
-        )
+        if debug:
+            logger.debug(
+                "Ollama response received | raw_len=%s clean_len=%s",
+                len(raw_text),
+                len(clean_text),
+            )
         return TranslationResponse(translated_text=clean_text)
 
+    def translate_batch(self, requests: Sequence[TranslationRequest]) -> list[TranslationResponse]:
+        """Translate several paragraphs with one /api/chat call and split the numbered reply."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Calling Ollama batch | model=%s paragraphs=%s text_len=%s",
+                self.settings.model,
+                len(requests),
+                sum(len(request.text) for request in requests),
+            )
+
+        payload = self._messages_payload(self.prompt_builder.build_batch_user_prompt(requests))
+        response = self._post_chat(payload)
+        self._validate_response_status(response)
+        raw_text = self._response_text(self._parse_payload(response))
+        pieces = _split_batch_response(raw_text, len(requests))
+        # Markers matched one-to-one, so a paragraph failing validation can be re-requested
+        # alone while its siblings are kept.
+        translations: list[str | None] = []
+        rejected: list[str] = []
+        for index, (piece, request) in enumerate(zip(pieces, requests), start=1):
+            try:
+                translations.append(_sanitise_response(piece, request.text))
+            except RetryableTranslationError as exc:
+                translations.append(None)
+                rejected.append(f"[[{index}]] {exc}")
+        if rejected:
+            message = f"Batch paragraphs rejected: {'; '.join(rejected)}"
+            if len(rejected) == len(requests):
+                raise RetryableTranslationError(message)
+            raise PartialBatchTranslationError(message, translations=translations)
+        return [TranslationResponse(translated_text=str(text)) for text in translations]
+
+
+def _retry_after_seconds(resp: requests.Response) -> float | None:
+    """Return the delay requested by a `Retry-After` header, or None when absent or invalid.
+
+    Accepts both forms allowed by RFC 9110: delta-seconds and an HTTP-date.
+    """
+    value = resp.headers.get("Retry-After")
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def _split_batch_response(raw: str, expected: int) -> list[str]:
+    """Split a numbered batch reply into `expected` paragraphs, in marker order.
+
+    Raises RetryableTranslationError unless markers 1..expected each appear exactly once.
+    """
+    parts = _BATCH_MARKER_RE.split(raw)
+    found: dict[int, str] = {}
+    for number, text in zip(parts[1::2], parts[2::2]):
+        index = int(number)
+        if index in found or not 1 <= index <= expected:
+            raise RetryableTranslationError(f"Unexpected batch marker [[{index}]] in response")
+        found[index] = text.strip()
+    if len(found) != expected:
+        raise RetryableTranslationError(
+            f"Batch response has {len(found)} of {expected} numbered paragraphs"
+        )
+    return [found[index] for index in range(1, expected + 1)]
+
+
+def _leaked_prompt_end(text: str) -> int | None:
+    """Return where the reply continues after its last echoed prompt label, or None.
+
+    The label's optional colon and surrounding whitespace count as part of it.
+    """
+    upper = text.upper()
+    if len(upper) != len(text):
+        match = _LEAKED_PROMPT_RE.search(text)
+        return match.end() if match else None
+    end = -1
+    for marker in _LEAKED_PROMPT_MARKERS:
+        index = upper.rfind(marker)
+        if index != -1:
+            end = max(end, index + len(marker))
+    if end == -1:
+        return None
+    rest = text[end:].lstrip()
+    if rest.startswith(":"):
+        rest = rest[1:].lstrip()
+    return len(text) - len(rest)
+
 
+# Cached translations are stored post-sanitisation: bump TRANSLATION_CACHE_VERSION on changes.
 def _sanitise_response(raw: str, source_text: str) -> str:
     """Strip leaked prompt/context sections and surrounding quotes from model response."""
     text = raw
 
-    if (text.startswith('"') and text.endswith('"')) or (
-        text.startswith("'") and text.endswith("'")
-    ):
+    # One slice comparison covers both quote styles; a lone quote still strips to "".
+    quote = text[:1]
+    if quote in ('"', "'") and text[-1] == quote:
         text = text[1:-1].strip()
 
     # Strip if model echoed a prompt label (e.g., "TEXT TO TRANSLATE: ...").
-    match = _LEAKED_PROMPT_RE.search(text)
-    if match:
-        after = text[match.end() :].strip()
+    leak_end = _leaked_prompt_end(text)
+    if leak_end is not None:
+        after = text[leak_end:].strip()
         if after:
             logger.warning(
                 "Stripped leaked prompt marker from response | stripped=%d remaining=%d",
@@ -157,9 +293,9 @@ def _sanitise_response(raw: str, source_text: str) -> str:
             text = after
 
     # Strip if model echoed the full fence-delimited text block ("<<<\n...\n>>>").
-    fence_match = _FENCE_ECHO_RE.search(text)
-    if fence_match and "<<<" in text[: fence_match.end()]:
-        after = text[fence_match.end() :].strip()
+    fence_close = text.rfind(">>>")
+    if fence_close != -1 and "<<<" in text[: fence_close + 3]:
+        after = text[fence_close + 3 :].strip()
         if after:
             logger.warning(
                 "Stripped fence-echoed block from response | stripped=%d remaining=%d",
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import IO, Any
 
@@ -12,6 +14,9 @@ from epub_translate_cli.domain.models import (
     TranslationSettings,
 )
 
+# Marker that numbers each paragraph of a batch prompt; replies must repeat it per paragraph.
+BATCH_MARKER_FORMAT = "[[{}]]"
+
 # Language codes (lowercase) mapped to canonical names used in prompts.
 _LANGUAGE_NAMES: dict[str, str] = {
     "it": "Italian",
@@ -102,30 +107,46 @@ def _target_language_rules(target_lang: str) -> str:
     return f"Language-specific rules for {lang_name}:\n{lines}\n\n"
 
 
+# Changing prompt wording changes translations: bump TRANSLATION_CACHE_VERSION with it.
+@lru_cache(maxsize=32)
+def _system_prompt(source_lang: str, target_lang: str) -> str:
+    """Return the system prompt for a language pair, built once and reused verbatim.
+
+    Every request of a run then sends the byte-identical system message, which keeps
+    the prompt prefix cacheable on the Ollama side.
+    """
+    src_name = _resolve_lang_name(source_lang)
+    tgt_name = _resolve_lang_name(target_lang)
+    return (
+        f"You are a professional book translator from {src_name} to {tgt_name}.\n\n"
+        "OUTPUT RULES (follow exactly):\n"
+        "- Output ONLY the translated text. Nothing else.\n"
+        "- Do NOT add commentary, labels, quotes, explanations, or meta-text.\n"
+        "- Do NOT repeat the instructions, context blocks, or source text.\n"
+        "- Preserve the meaning, tone, narrative voice, and style of the original.\n"
+        "- Keep sentence-ending punctuation (., !, ?, ;, :) when the source uses it.\n"
+        "- Do not drop commas or full stops; maintain natural read-aloud rhythm.\n"
+        "- Translate proper nouns consistently: use the same rendering for each name "
+        "throughout the text.\n\n"
+        f"{_target_language_rules(target_lang)}"
+    )
+
+
 @dataclass(frozen=True)
 class PromptBuilder:
     """Builds deterministic translation prompts for Ollama /api/chat requests."""
 
     def build_system_prompt(self, settings: TranslationSettings) -> str:
         """Build the system role message: persona, output rules, language-specific guidance."""
-        src_name = _resolve_lang_name(settings.source_lang)
-        tgt_name = _resolve_lang_name(settings.target_lang)
-        return (
-            f"You are a professional book translator from {src_name} to {tgt_name}.\n\n"
-            "OUTPUT RULES (follow exactly):\n"
-            "- Output ONLY the translated text. Nothing else.\n"
-            "- Do NOT add commentary, labels, quotes, explanations, or meta-text.\n"
-            "- Do NOT repeat the instructions, context blocks, or source text.\n"
-            "- Preserve the meaning, tone, narrative voice, and style of the original.\n"
-            "- Keep sentence-ending punctuation (., !, ?, ;, :) when the source uses it.\n"
-            "- Do not drop commas or full stops; maintain natural read-aloud rhythm.\n"
-            "- Translate proper nouns consistently: use the same rendering for each name "
-            "throughout the text.\n\n"
-            f"{_target_language_rules(settings.target_lang)}"
-        )
+        return _system_prompt(settings.source_lang, settings.target_lang)
 
     def build_user_prompt(self, request: TranslationRequest) -> str:
-        """Build the user role message: context blocks and the text to translate."""
+        """Build the user role message: context blocks and the text to translate.
+
+        Blocks are ordered from most to least stable (chapter context, then the rolling
+        prior translations, then the text) so consecutive requests of one chapter share
+        the longest possible prompt prefix, which Ollama reuses from its KV cache.
+        """
         return (
             f"{self._context_block(request.chapter_context)}"
             f"{self._prior_translations_block(request.prior_translations)}"
@@ -133,9 +154,39 @@ class PromptBuilder:
             f"<<<\n{request.text}\n>>>"
         )
 
+    def build_batch_user_prompt(self, requests: Sequence[TranslationRequest]) -> str:
+        """Build one user message with shared context blocks and numbered paragraphs."""
+        first = requests[0]
+        return (
+            f"{self._context_block(first.chapter_context)}"
+            f"{self._prior_translations_block(first.prior_translations)}"
+            f"{self._numbered_paragraphs_block(requests)}"
+        )
+
     @staticmethod
+    def _numbered_paragraphs_block(requests: Sequence[TranslationRequest]) -> str:
+        """Format paragraphs as `[[n]] text` lines plus the strict one-per-marker reply rule."""
+        lines = "\n".join(
+            f"{BATCH_MARKER_FORMAT.format(index)} {' '.join(request.text.split())}"
+            for index, request in enumerate(requests, start=1)
+        )
+        return (
+            f"Translate each of the following {len(requests)} numbered paragraphs "
+            "independently.\n"
+            f"Reply with exactly {len(requests)} paragraphs, each on its own line and "
+            "starting with the same [[n]] marker as its source. "
+            "Do not merge, split, skip, or reorder paragraphs.\n"
+            f"<<<\n{lines}\n>>>"
+        )
+
+    @staticmethod
+    @lru_cache(maxsize=64)
     def _context_block(chapter_context: str) -> str:
-        """Format chapter-level context used only for tone and terminology guidance."""
+        """Format chapter-level context used only for tone and terminology guidance.
+
+        Every request of a chapter carries the same context string (whose hash Python
+        caches), so the block is formatted once per chapter rather than per paragraph.
+        """
         if not chapter_context:
             return ""
         return (
@@ -167,13 +218,12 @@ class GlossaryAwarePromptBuilder:
     def build_user_prompt(self, request: TranslationRequest) -> str:
         """Build user prompt with optional glossary block prepended."""
         glossary_block = self._glossary_block(request.glossary_terms)
-        base = (
-            f"{PromptBuilder._context_block(request.chapter_context)}"
-            f"{PromptBuilder._prior_translations_block(request.prior_translations)}"
-            "Translate the following text:\n"
-            f"<<<\n{request.text}\n>>>"
-        )
-        return f"{glossary_block}{base}"
+        return f"{glossary_block}{PromptBuilder().build_user_prompt(request)}"
+
+    def build_batch_user_prompt(self, requests: Sequence[TranslationRequest]) -> str:
+        """Build batch user prompt with optional glossary block prepended."""
+        glossary_block = self._glossary_block(requests[0].glossary_terms)
+        return f"{glossary_block}{PromptBuilder().build_batch_user_prompt(requests)}"
 
     @staticmethod
     def _glossary_block(glossary_terms: dict[str, str]) -> str:
@@ -19,5 +19,9 @@ def configure_logging(level: str = "INFO") -> None:
 
 
 def create_logger(name: str) -> logging.Logger:
-    """Return module-scoped logger from configured logging hierarchy."""
+    """Return module-scoped logger from configured logging hierarchy.
+
+    Module loggers never get handlers of their own; records propagate to the single
+    root handler installed by `configure_logging`.
+    """
     return logging.getLogger(name)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import shutil
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, get_args
 
@@ -16,6 +16,7 @@ from epub_translate_cli.domain.models import (
     TranslationSettings,
 )
 from epub_translate_cli.infrastructure.logging.logger_factory import create_logger
+from epub_translate_cli.infrastructure.reporting.serialization import dataclass_fields
 
 logger = create_logger(__name__)
 
@@ -55,6 +56,9 @@ class FilesystemChapterStageStore:
             "temperature": settings.temperature,
             "retries": settings.retries,
             "context_paragraphs": settings.context_paragraphs,
+            "context_token_budget": settings.context_token_budget,
+            "paragraph_lookahead": settings.paragraph_lookahead,
+            "paragraph_batch_size": settings.paragraph_batch_size,
             "workers": settings.workers,
             "input_exists": input_exists,
             "input_size": input_stats.st_size if input_stats is not None else 0,
@@ -109,11 +113,14 @@ class FilesystemChapterStageStore:
         self._write_bytes_atomic(self.workspace_dir / chapter_rel, xhtml_bytes)
         self._write_text_atomic(
             self.workspace_dir / report_rel,
+            # The default hook expands nested dataclasses one level at a time as the
+            # encoder reaches them, instead of asdict() deep-copying the whole report.
             json.dumps(
-                asdict(report),
+                report,
                 ensure_ascii=False,
                 indent=2,
                 sort_keys=True,
+                default=dataclass_fields,
             ),
         )
 
@@ -1,32 +1,63 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
 
 from epub_translate_cli.domain.models import RunReport
 from epub_translate_cli.domain.ports import ReportWriterPort
 from epub_translate_cli.infrastructure.logging.logger_factory import create_logger
+from epub_translate_cli.infrastructure.reporting.serialization import dataclass_fields
 
 logger = create_logger(__name__)
 
 
+def _load_orjson() -> Any:
+    """Return the `orjson` module when installed, else None.
+
+    orjson serializes nested dataclasses natively and several times faster than stdlib json.
+    """
+    try:
+        import orjson  # type: ignore[import-not-found,unused-ignore]
+
+        return orjson
+    except ImportError:
+        return None
+
+
+_orjson = _load_orjson()
+
+
 @dataclass(frozen=True)
 class JsonReportWriter(ReportWriterPort):
     """Report writer that serializes run reports to UTF-8 JSON files."""
 
     @staticmethod
     def _payload(report: RunReport) -> dict[str, object]:
-        """Build serializable payload including computed totals section."""
-        payload = asdict(report)
+        """Build serializable payload including computed totals section.
+
+        Chapter sections stay dataclass instances; the encoder walks them directly.
+        """
+        payload = dataclass_fields(report)
         payload["totals"] = report.totals()
         return payload
 
+    @staticmethod
+    def _dump(payload: dict[str, object], report_path: Path) -> None:
+        """Write payload as indented UTF-8 JSON, preferring orjson when available.
+
+        The stdlib fallback streams encoder chunks into the file instead of building the
+        whole document as one string and then again as bytes.
+        """
+        if _orjson is not None:
+            report_path.write_bytes(bytes(_orjson.dumps(payload, option=_orjson.OPT_INDENT_2)))
+            return
+        with report_path.open("w", encoding="utf-8") as handle:
+            json.dump(payload, handle, ensure_ascii=False, indent=2, default=dataclass_fields)
+
     def write(self, report: RunReport, report_path: Path) -> None:
         """Write report payload to disk, creating parent directories when needed."""
         report_path.parent.mkdir(parents=True, exist_ok=True)
-        report_path.write_text(
-            json.dumps(self._payload(report), ensure_ascii=False, indent=2),
-            encoding="utf-8",
-        )
+        self._dump(self._payload(report), report_path)
         logger.debug("Report written | path=%s", report_path)
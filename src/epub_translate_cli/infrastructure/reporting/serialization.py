@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+import dataclasses
+from typing import Any
+
+
+def dataclass_fields(value: object) -> dict[str, Any]:
+    """json `default` hook: expose one dataclass level without `asdict`'s deep copy."""
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {f.name: getattr(value, f.name) for f in dataclasses.fields(value)}
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
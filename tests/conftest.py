@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from dataclasses import replace
+from typing import Any
+
+from epub_translate_cli.domain.models import TranslationSettings
+
+_BASE_SETTINGS = TranslationSettings(
+    source_lang="en",
+    target_lang="it",
+    model="x",
+    temperature=0.2,
+    retries=0,
+    abort_on_error=False,
+)
+
+
+def make_settings(**overrides: Any) -> TranslationSettings:
+    """Return the shared en→it test settings with `overrides` applied."""
+    return replace(_BASE_SETTINGS, **overrides)
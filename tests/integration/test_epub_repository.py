@@ -0,0 +1,194 @@
+from __future__ import annotations
+
+import os
+import struct
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from epub_translate_cli.domain.models import EpubBook, ItemOverlay
+from epub_translate_cli.infrastructure.epub import epub_repository
+from epub_translate_cli.infrastructure.epub.epub_repository import (
+    ZipArchiveItems,
+    ZipEpubRepository,
+)
+
+_CHAPTER = b"""<?xml version='1.0' encoding='utf-8'?>
+<html xmlns='http://www.w3.org/1999/xhtml'>
+  <body><p>Chapter text.</p></body>
+</html>"""
+
+_IMAGE = os.urandom(2048) + b"\x00" * 8192
+
+_SOURCE_DATE_TIME = (2001, 2, 3, 4, 5, 6)
+
+
+def _build_epub(path: Path) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        zf.writestr("mimetype", "application/epub+zip", zipfile.ZIP_STORED)
+        for name, data in (("OEBPS/ch1.xhtml", _CHAPTER), ("OEBPS/cover.png", _IMAGE)):
+            info = zipfile.ZipInfo(name, date_time=_SOURCE_DATE_TIME)
+            zf.writestr(info, data, zipfile.ZIP_DEFLATED)
+    return path
+
+
+def test_load_reads_items_lazily(tmp_path: Path) -> None:
+    repo = ZipEpubRepository()
+    book = repo.load(_build_epub(tmp_path / "book.epub"))
+
+    assert list(book.items) == ["mimetype", "OEBPS/ch1.xhtml", "OEBPS/cover.png"]
+    assert "OEBPS/cover.png" in book.items
+    assert book.items["OEBPS/cover.png"] == _IMAGE
+    assert [c.path for c in book.chapters] == ["OEBPS/ch1.xhtml"]
+
+    repo.close(book)
+    assert isinstance(book.items, ZipArchiveItems)
+    assert book.items._fh.closed and book.items._raw_fp.closed
+
+
+def test_save_copies_untouched_members_raw(tmp_path: Path) -> None:
+    src = _build_epub(tmp_path / "book.epub")
+    out = tmp_path / "out.epub"
+    repo = ZipEpubRepository()
+    book = repo.load(src)
+
+    translated = _CHAPTER.replace(b"Chapter text.", b"Testo del capitolo.")
+    repo.save(
+        EpubBook(
+            items=ItemOverlay(base=book.items, overrides={"OEBPS/ch1.xhtml": translated}),
+            chapters=book.chapters,
+            compression_types=book.compression_types,
+        ),
+        out,
+    )
+
+    with zipfile.ZipFile(src) as before, zipfile.ZipFile(out) as after:
+        assert after.testzip() is None
+        assert after.namelist()[0] == "mimetype"
+        assert after.getinfo("mimetype").compress_type == zipfile.ZIP_STORED
+        assert after.read("OEBPS/ch1.xhtml") == translated
+        assert after.read("OEBPS/cover.png") == _IMAGE
+        src_info = before.getinfo("OEBPS/cover.png")
+        out_info = after.getinfo("OEBPS/cover.png")
+        assert (out_info.CRC, out_info.compress_size) == (src_info.CRC, src_info.compress_size)
+
+
+def _local_extra(archive_path: Path, info: zipfile.ZipInfo) -> bytes:
+    with archive_path.open("rb") as fh:
+        fh.seek(info.header_offset + 26)
+        name_len, extra_len = struct.unpack("<2H", fh.read(4))
+        fh.seek(name_len, 1)
+        return fh.read(extra_len)
+
+
+def test_save_copies_local_extra_and_drops_central_zip64_field(tmp_path: Path) -> None:
+    local_extra = b"\x99\x99\x04\x00ABCD"
+    central_zip64 = b"\x01\x00\x04\x00\x00\x00\x00\x00"
+    src = tmp_path / "book.epub"
+    with zipfile.ZipFile(src, "w") as zf:
+        zf.writestr("mimetype", "application/epub+zip", zipfile.ZIP_STORED)
+        zf.writestr("OEBPS/ch1.xhtml", _CHAPTER, zipfile.ZIP_DEFLATED)
+        info = zipfile.ZipInfo("OEBPS/cover.png", date_time=_SOURCE_DATE_TIME)
+        info.extra = local_extra
+        zf.writestr(info, _IMAGE, zipfile.ZIP_DEFLATED)
+    # Give the central record a different, ZIP64-only extra field of the same length.
+    data = src.read_bytes()
+    central_at = data.rindex(local_extra)
+    src.write_bytes(data[:central_at] + central_zip64 + data[central_at + len(local_extra) :])
+    out = tmp_path / "out.epub"
+    repo = ZipEpubRepository()
+    book = repo.load(src)
+
+    translated = _CHAPTER.replace(b"Chapter text.", b"Testo del capitolo.")
+    repo.save(
+        EpubBook(
+            items=ItemOverlay(base=book.items, overrides={"OEBPS/ch1.xhtml": translated}),
+            chapters=book.chapters,
+            compression_types=book.compression_types,
+        ),
+        out,
+    )
+
+    with zipfile.ZipFile(src) as before, zipfile.ZipFile(out) as after:
+        assert before.getinfo("OEBPS/cover.png").extra == central_zip64
+        assert after.testzip() is None
+        assert after.read("OEBPS/cover.png") == _IMAGE
+        out_info = after.getinfo("OEBPS/cover.png")
+        assert out_info.extra == b""
+        assert _local_extra(out, out_info) == local_extra
+
+
+def test_save_in_place_over_source_archive(tmp_path: Path) -> None:
+    src = _build_epub(tmp_path / "book.epub")
+    repo = ZipEpubRepository()
+    book = repo.load(src)
+
+    repo.save(book, src)
+
+    assert isinstance(book.items, ZipArchiveItems)
+    assert book.items._fh.closed and book.items._raw_fp.closed
+    with zipfile.ZipFile(src) as zf:
+        assert zf.testzip() is None
+        assert zf.read("OEBPS/cover.png") == _IMAGE
+        assert zf.read("OEBPS/ch1.xhtml") == _CHAPTER
+    assert not src.with_suffix(".epub.tmp").exists()
+
+
+def test_save_rewrites_every_overridden_member(tmp_path: Path) -> None:
+    src = _build_epub(tmp_path / "book.epub")
+    out = tmp_path / "out.epub"
+    repo = ZipEpubRepository()
+    book = repo.load(src)
+
+    repo.save(
+        EpubBook(
+            items=ItemOverlay(base=book.items, overrides={"OEBPS/ch1.xhtml": _CHAPTER}),
+            chapters=book.chapters,
+            compression_types=book.compression_types,
+        ),
+        out,
+    )
+
+    with zipfile.ZipFile(out) as zf:
+        assert zf.testzip() is None
+        assert zf.read("OEBPS/ch1.xhtml") == _CHAPTER
+        assert zf.getinfo("OEBPS/ch1.xhtml").date_time != _SOURCE_DATE_TIME
+        assert zf.getinfo("OEBPS/cover.png").date_time == _SOURCE_DATE_TIME
+
+
+def test_save_unchanged_book_clones_source_file(tmp_path: Path) -> None:
+    src = _build_epub(tmp_path / "book.epub")
+    out = tmp_path / "out.epub"
+    repo = ZipEpubRepository()
+
+    repo.save(repo.load(src), out)
+
+    assert out.read_bytes() == src.read_bytes()
+
+
+def test_save_without_raw_copy_support_writes_valid_archive(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(epub_repository, "_RAW_COPY_SUPPORTED", False)
+    src = _build_epub(tmp_path / "book.epub")
+    out = tmp_path / "out.epub"
+    repo = ZipEpubRepository()
+    book = repo.load(src)
+
+    translated = _CHAPTER.replace(b"Chapter text.", b"Testo del capitolo.")
+    repo.save(
+        EpubBook(
+            items=ItemOverlay(base=book.items, overrides={"OEBPS/ch1.xhtml": translated}),
+            chapters=book.chapters,
+            compression_types=book.compression_types,
+        ),
+        out,
+    )
+
+    with zipfile.ZipFile(out) as zf:
+        assert zf.testzip() is None
+        assert zf.namelist() == ["mimetype", "OEBPS/ch1.xhtml", "OEBPS/cover.png"]
+        assert zf.read("OEBPS/ch1.xhtml") == translated
+        assert zf.read("OEBPS/cover.png") == _IMAGE
+        assert zf.getinfo("OEBPS/cover.png").date_time == _SOURCE_DATE_TIME
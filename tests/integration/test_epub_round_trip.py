@@ -127,7 +127,9 @@ def test_full_round_trip_preserves_spine_order(tmp_path: Path) -> None:
     assert result.failures == 0
 
     # Reload translated EPUB and verify chapter content and spine order.
-    reloaded = ZipEpubRepository().load(out_path)
+    repo = ZipEpubRepository()
+    reloaded = repo.load(out_path)
+    repo.close(reloaded)
     assert len(reloaded.chapters) == 2
 
     paths = [c.path for c in reloaded.chapters]
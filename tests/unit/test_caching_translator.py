@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+
+import pytest
+
+from epub_translate_cli.application.services import caching_translator
+from epub_translate_cli.application.services.caching_translator import (
+    CachingTranslator,
+    translation_cache_key,
+)
+from epub_translate_cli.domain.errors import PartialBatchTranslationError
+from epub_translate_cli.domain.models import (
+    TranslationRequest,
+    TranslationResponse,
+)
+from epub_translate_cli.infrastructure.cache.memory_translation_cache import (
+    InMemoryTranslationCache,
+)
+from epub_translate_cli.infrastructure.cache.sqlite_translation_cache import (
+    SqliteTranslationCache,
+)
+from tests.conftest import make_settings
+
+_SETTINGS = make_settings()
+
+
+@dataclass
+class RejectingBatchTranslator:
+    """Batch translator that rejects the paragraph reading "Bad"."""
+
+    def translate(self, request: TranslationRequest) -> TranslationResponse:
+        return TranslationResponse(translated_text=f"[T] {request.text}")
+
+    def translate_batch(self, requests: Sequence[TranslationRequest]) -> list[TranslationResponse]:
+        translations = [None if r.text == "Bad" else f"[B] {r.text}" for r in requests]
+        raise PartialBatchTranslationError("rejected", translations=translations)
+
+
+@dataclass
+class CountingTranslator:
+    calls: list[str] = field(default_factory=list)
+
+    def translate(self, request: TranslationRequest) -> TranslationResponse:
+        self.calls.append(request.text)
+        return TranslationResponse(translated_text=f"[T] {request.text}")
+
+
+def test_identical_text_is_translated_once(tmp_path: Path) -> None:
+    inner = CountingTranslator()
+    with SqliteTranslationCache(tmp_path / "cache.sqlite") as cache:
+        translator = CachingTranslator(translator=inner, settings=_SETTINGS, cache=cache)
+
+        first = translator.translate(TranslationRequest(chapter_context="a", text="Chapter One"))
+        second = translator.translate(TranslationRequest(chapter_context="b", text="Chapter One"))
+
+    assert first == second
+    assert inner.calls == ["Chapter One"]
+
+
+def test_cache_persists_across_instances(tmp_path: Path) -> None:
+    cache_path = tmp_path / "cache.sqlite"
+    request = TranslationRequest(chapter_context="", text="Hello")
+    with SqliteTranslationCache(cache_path) as cache:
+        CachingTranslator(
+            translator=CountingTranslator(), settings=_SETTINGS, cache=cache
+        ).translate(request)
+
+    inner = CountingTranslator()
+    with SqliteTranslationCache(cache_path) as cache:
+        result = CachingTranslator(translator=inner, settings=_SETTINGS, cache=cache).translate(
+            request
+        )
+
+    assert result.translated_text == "[T] Hello"
+    assert inner.calls == []
+
+
+def test_different_target_language_misses_cache(tmp_path: Path) -> None:
+    request = TranslationRequest(chapter_context="", text="Hello")
+    inner = CountingTranslator()
+    french = make_settings(target_lang="fr")
+    with SqliteTranslationCache(tmp_path / "cache.sqlite") as cache:
+        CachingTranslator(translator=inner, settings=_SETTINGS, cache=cache).translate(request)
+        CachingTranslator(translator=inner, settings=french, cache=cache).translate(request)
+
+    assert inner.calls == ["Hello", "Hello"]
+
+
+def test_batch_translates_only_cache_misses(tmp_path: Path) -> None:
+    inner = CountingTranslator()
+    with SqliteTranslationCache(tmp_path / "cache.sqlite") as cache:
+        translator = CachingTranslator(translator=inner, settings=_SETTINGS, cache=cache)
+        translator.translate(TranslationRequest(chapter_context="", text="Hello"))
+
+        results = translator.translate_batch(
+            [TranslationRequest(chapter_context="", text=t) for t in ("Hello", "World")]
+        )
+
+    assert [r.translated_text for r in results] == ["[T] Hello", "[T] World"]
+    assert inner.calls == ["Hello", "World"]
+
+
+def test_batch_translates_repeated_paragraphs_once() -> None:
+    inner = CountingTranslator()
+    translator = CachingTranslator(
+        translator=inner, settings=_SETTINGS, cache=InMemoryTranslationCache()
+    )
+
+    results = translator.translate_batch(
+        [TranslationRequest(chapter_context="", text=t) for t in ("* * *", "Body", "* * *")]
+    )
+
+    assert [r.translated_text for r in results] == ["[T] * * *", "[T] Body", "[T] * * *"]
+    assert inner.calls == ["* * *", "Body"]
+
+
+def test_in_memory_cache_dedupes_and_evicts_least_recently_used() -> None:
+    inner = CountingTranslator()
+    translator = CachingTranslator(
+        translator=inner,
+        settings=_SETTINGS,
+        cache=InMemoryTranslationCache(max_entries=2),
+    )
+
+    for text in ["Chapter One", "Dedication", "Chapter One", "Notes", "Dedication"]:
+        translator.translate(TranslationRequest(chapter_context="", text=text))
+
+    assert inner.calls == ["Chapter One", "Dedication", "Notes", "Dedication"]
+
+
+def test_partial_batch_caches_accepted_paragraphs_and_keeps_hits() -> None:
+    cache = InMemoryTranslationCache()
+    translator = CachingTranslator(
+        translator=RejectingBatchTranslator(), settings=_SETTINGS, cache=cache
+    )
+    translator.translate(TranslationRequest(chapter_context="", text="Hit"))
+    texts = ("Hit", "Good", "Bad", "Fine")
+
+    with pytest.raises(PartialBatchTranslationError) as info:
+        translator.translate_batch([TranslationRequest(chapter_context="", text=t) for t in texts])
+
+    assert info.value.translations == ["[T] Hit", "[B] Good", None, "[B] Fine"]
+    again = translator.translate(TranslationRequest(chapter_context="", text="Good"))
+    assert again.translated_text == "[B] Good"
+
+
+def test_cache_key_changes_with_pipeline_version(monkeypatch: pytest.MonkeyPatch) -> None:
+    request = TranslationRequest(chapter_context="", text="Hello")
+    before = translation_cache_key(_SETTINGS, request)
+
+    monkeypatch.setattr(
+        caching_translator,
+        "TRANSLATION_CACHE_VERSION",
+        caching_translator.TRANSLATION_CACHE_VERSION + 1,
+    )
+
+    assert translation_cache_key(_SETTINGS, request) != before
+
+
+def test_cache_key_changes_with_context_settings() -> None:
+    request = TranslationRequest(chapter_context="", text="Hello")
+    before = translation_cache_key(_SETTINGS, request)
+
+    assert translation_cache_key(replace(_SETTINGS, context_paragraphs=5), request) != before
+    assert translation_cache_key(replace(_SETTINGS, context_token_budget=64), request) != before
+    assert translation_cache_key(_SETTINGS, replace(request, chapter_context="Chapter 2")) == before
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+from epub_translate_cli.domain.models import ChapterDocument
+from epub_translate_cli.infrastructure.epub.xhtml_parser import XHTMLTranslator, _chapter_parser
+
+
+def _tags_and_texts(xhtml: bytes) -> list[tuple[str, str]]:
+    _, nodes = XHTMLTranslator().parse_chapter(ChapterDocument(path="c.xhtml", xhtml_bytes=xhtml))
+    return [(node.tag, node.source_text) for _, node in nodes]
+
+
+def test_namespaced_candidates_are_collected_in_document_order() -> None:
+    xhtml = (
+        b"<html xmlns='http://www.w3.org/1999/xhtml'><body>"
+        b"<h1>Title</h1><div><p>One</p><h2>Sub</h2></div><p>Two</p>"
+        b"</body></html>"
+    )
+    assert _tags_and_texts(xhtml) == [("h1", "Title"), ("p", "One"), ("h2", "Sub"), ("p", "Two")]
+
+
+def test_candidates_without_namespace_are_collected() -> None:
+    xhtml = b"<html><body><p>One</p><span>no</span><h3>Three</h3></body></html>"
+    assert _tags_and_texts(xhtml) == [("p", "One"), ("h3", "Three")]
+
+
+def test_chapter_context_samples_namespaced_paragraphs() -> None:
+    xhtml = (
+        b"<html xmlns='http://www.w3.org/1999/xhtml'><body>"
+        b"<p>First</p><p>Middle</p><p>Last</p></body></html>"
+    )
+    root, _ = XHTMLTranslator().parse_chapter(ChapterDocument(path="c.xhtml", xhtml_bytes=xhtml))
+    assert XHTMLTranslator.chapter_context(root) == "First [...] Middle [...] Last"
+
+
+def test_paragraph_context_matches_tree_walk() -> None:
+    xhtml = (
+        b"<html xmlns='http://www.w3.org/1999/xhtml'><body>"
+        b"<p>First</p><h2>Skip</h2><p> </p><p>Middle <b>bold</b></p><p>Last</p></body></html>"
+    )
+    root, nodes = XHTMLTranslator().parse_chapter(
+        ChapterDocument(path="c.xhtml", xhtml_bytes=xhtml)
+    )
+    from_nodes = XHTMLTranslator.paragraph_context(n.source_text for _, n in nodes if n.tag == "p")
+    assert from_nodes == XHTMLTranslator.chapter_context(root)
+
+
+def test_source_text_joins_inline_text_without_element_tail() -> None:
+    xhtml = (
+        b"<html xmlns='http://www.w3.org/1999/xhtml'><body>"
+        b"<p> Lead <em>italic</em><!-- note --> and &amp; <span>more</span> </p>tail"
+        b"</body></html>"
+    )
+    assert _tags_and_texts(xhtml) == [("p", "Lead italic and & more")]
+
+
+def test_node_paths_match_lxml_getpath() -> None:
+    xhtml = (
+        b"<html xmlns='http://www.w3.org/1999/xhtml' xmlns:epub='http://www.idpf.org/2007/ops'>"
+        b"<body><h1>T</h1><!-- c --><p>One</p><epub:switch/><div><p>Two</p></div>"
+        b"<p>Three</p><section xmlns=''><p>Four</p><p>Five</p></section></body></html>"
+    )
+    root, nodes = XHTMLTranslator().parse_chapter(
+        ChapterDocument(path="c.xhtml", xhtml_bytes=xhtml)
+    )
+    get_path = root.getroottree().getpath
+
+    assert [node.node_path for _, node in nodes] == [get_path(elem) for elem, _ in nodes]
+    assert len(nodes) == 6
+
+
+def test_parser_is_reused_per_thread_and_keeps_trees_independent() -> None:
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        other_thread_parser = pool.submit(_chapter_parser).result()
+
+    assert _chapter_parser() is _chapter_parser()
+    assert other_thread_parser is not _chapter_parser()
+    assert _tags_and_texts(b"<html><body><p>One</p></body></html>") == [("p", "One")]
+    assert _tags_and_texts(b"<html><body><h2>Two</h2></body></html>") == [("h2", "Two")]
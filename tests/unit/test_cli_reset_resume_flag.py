@@ -2,7 +2,10 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from epub_translate_cli.cli import _build_command
+import pytest
+import typer
+
+from epub_translate_cli.cli import _build_command, _default_workers, translate
 
 
 def test_build_command_sets_reset_resume_state(tmp_path: Path) -> None:
@@ -31,3 +34,26 @@ def test_build_command_sets_reset_resume_state(tmp_path: Path) -> None:
 
     assert command.reset_resume_state is True
     assert command.report_path == output_path.with_suffix(".epub.report.json")
+
+
+def test_default_workers_clamps_ollama_num_parallel(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("OLLAMA_NUM_PARALLEL", "64")
+    assert _default_workers() == 32
+
+    monkeypatch.setenv("OLLAMA_NUM_PARALLEL", "3")
+    assert _default_workers() == 3
+
+    monkeypatch.setenv("OLLAMA_NUM_PARALLEL", "not-a-number")
+    assert _default_workers() == 1
+
+    monkeypatch.delenv("OLLAMA_NUM_PARALLEL")
+    assert _default_workers() == 1
+
+
+def test_cli_command_builds_on_every_supported_python() -> None:
+    app = typer.Typer()
+    app.command()(translate)
+
+    params = {param.name for param in typer.main.get_command(app).params}
+
+    assert {"report_out", "workers", "glossary"} <= params
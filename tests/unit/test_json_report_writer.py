@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from epub_translate_cli.domain.models import ChapterReport, NodeChange, NodeSkip, RunReport
+from epub_translate_cli.infrastructure.reporting import json_report_writer
+from epub_translate_cli.infrastructure.reporting.json_report_writer import JsonReportWriter
+
+
+def _report() -> RunReport:
+    return RunReport(
+        input_path="in.epub",
+        output_path="out.epub",
+        report_path="out.epub.report.json",
+        model="x",
+        source_lang="en",
+        target_lang="it",
+        temperature=0.2,
+        retries=1,
+        abort_on_error=False,
+        output_written=True,
+        chapters=(
+            ChapterReport(
+                chapter_path="OEBPS/ch1.xhtml",
+                changes=(NodeChange("OEBPS/ch1.xhtml", "/p[1]", "Hello", "Ciao è"),),
+                failures=(),
+                skips=(NodeSkip("OEBPS/ch1.xhtml", "/p[2]", "empty"),),
+            ),
+        ),
+    )
+
+
+def _write_and_load(tmp_path: Path) -> tuple[str, dict[str, Any]]:
+    path = tmp_path / "report.json"
+    JsonReportWriter().write(_report(), path)
+    text = path.read_text(encoding="utf-8")
+    return text, json.loads(text)
+
+
+def _assert_payload(text: str, payload: dict[str, Any]) -> None:
+    assert "Ciao è" in text
+    assert payload["chapters"][0]["changes"][0] == {
+        "chapter_path": "OEBPS/ch1.xhtml",
+        "node_path": "/p[1]",
+        "before": "Hello",
+        "after": "Ciao è",
+    }
+    assert payload["chapters"][0]["skips"][0]["reason"] == "empty"
+    assert payload["totals"] == {"chapters": 1, "changed": 1, "failed": 0, "skipped": 1}
+
+
+def test_stdlib_encoder_serializes_nested_sections(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(json_report_writer, "_orjson", None)
+    _assert_payload(*_write_and_load(tmp_path))
+
+
+def test_orjson_encoder_serializes_nested_sections(tmp_path: Path) -> None:
+    if json_report_writer._orjson is None:
+        pytest.skip("orjson not installed")
+    _assert_payload(*_write_and_load(tmp_path))
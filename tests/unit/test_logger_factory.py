@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import logging
+
+from epub_translate_cli.infrastructure.logging.logger_factory import (
+    configure_logging,
+    create_logger,
+)
+
+
+def test_module_loggers_share_single_root_handler() -> None:
+    root = logging.getLogger()
+    saved_handlers, saved_level = root.handlers[:], root.level
+    root.handlers = []
+    try:
+        configure_logging("DEBUG")
+        configure_logging("INFO")
+        logger = create_logger("epub_translate_cli.some_module")
+
+        assert len(root.handlers) == 1
+        assert logger.handlers == []
+        assert logger.propagate is True
+        assert create_logger("epub_translate_cli.some_module") is logger
+    finally:
+        root.handlers = saved_handlers
+        root.setLevel(saved_level)
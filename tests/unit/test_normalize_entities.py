@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from epub_translate_cli.infrastructure.epub.xhtml_parser import _normalize_non_xml_entities
+
+
+def test_html_entities_become_numeric_references() -> None:
+    raw = b"<p>a&nbsp;b &mdash; &ldquo;c&rdquo;&hellip; &amp;</p>"
+    assert (
+        _normalize_non_xml_entities(raw) == b"<p>a&#160;b &#8212; &#8220;c&#8221;&#8230; &amp;</p>"
+    )
+
+
+def test_chapter_without_html_entities_is_not_copied() -> None:
+    raw = b"<p>plain &amp; simple</p>"
+    assert _normalize_non_xml_entities(raw) is raw
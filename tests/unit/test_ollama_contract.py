@@ -5,7 +5,11 @@ from unittest.mock import MagicMock, patch
 import pytest
 import requests as req_lib
 
-from epub_translate_cli.domain.errors import NonRetryableTranslationError, RetryableTranslationError
+from epub_translate_cli.domain.errors import (
+    NonRetryableTranslationError,
+    PartialBatchTranslationError,
+    RetryableTranslationError,
+)
 from epub_translate_cli.domain.models import TranslationRequest, TranslationSettings
 from epub_translate_cli.infrastructure.llm.ollama_translator import OllamaTranslator
 from epub_translate_cli.infrastructure.llm.prompt_builder import PromptBuilder
@@ -42,19 +46,19 @@ def _mock_response(status: int, json_data: object = None, text: str = "") -> Mag
 
 def test_success_returns_translation() -> None:
     payload = {"message": {"content": "Ciao mondo."}}
-    with patch("requests.post", return_value=_mock_response(200, payload)):
+    with patch("requests.Session.post", return_value=_mock_response(200, payload)):
         result = _translator().translate(_REQUEST)
     assert result.translated_text == "Ciao mondo."
 
 
 def test_http_500_raises_retryable() -> None:
-    with patch("requests.post", return_value=_mock_response(500)):  # noqa: SIM117
+    with patch("requests.Session.post", return_value=_mock_response(500)):  # noqa: SIM117
         with pytest.raises(RetryableTranslationError, match="server error"):
             _translator().translate(_REQUEST)
 
 
 def test_http_400_raises_non_retryable() -> None:
-    with patch("requests.post", return_value=_mock_response(400, text="bad request")):  # noqa: SIM117
+    with patch("requests.Session.post", return_value=_mock_response(400, text="bad request")):  # noqa: SIM117
         with pytest.raises(NonRetryableTranslationError, match="request failed"):
             _translator().translate(_REQUEST)
 
@@ -65,26 +69,85 @@ def test_json_decode_error_raises_retryable() -> None:
     resp = MagicMock()
     resp.status_code = 200
     resp.json.side_effect = _json.JSONDecodeError("bad json", "", 0)
-    with patch("requests.post", return_value=resp):  # noqa: SIM117
+    with patch("requests.Session.post", return_value=resp):  # noqa: SIM117
         with pytest.raises(RetryableTranslationError):
             _translator().translate(_REQUEST)
 
 
 def test_empty_message_content_raises_retryable() -> None:
     payload = {"message": {"content": ""}}
-    with patch("requests.post", return_value=_mock_response(200, payload)):  # noqa: SIM117
+    with patch("requests.Session.post", return_value=_mock_response(200, payload)):  # noqa: SIM117
         with pytest.raises(RetryableTranslationError, match="Empty"):
             _translator().translate(_REQUEST)
 
 
 def test_missing_message_field_raises_retryable() -> None:
     payload = {"response": "legacy field"}
-    with patch("requests.post", return_value=_mock_response(200, payload)):  # noqa: SIM117
+    with patch("requests.Session.post", return_value=_mock_response(200, payload)):  # noqa: SIM117
         with pytest.raises(RetryableTranslationError, match="Missing 'message'"):
             _translator().translate(_REQUEST)
 
 
 def test_request_exception_raises_retryable() -> None:
-    with patch("requests.post", side_effect=req_lib.RequestException("timeout")):  # noqa: SIM117
+    with patch("requests.Session.post", side_effect=req_lib.RequestException("timeout")):  # noqa: SIM117
         with pytest.raises(RetryableTranslationError, match="timeout"):
             _translator().translate(_REQUEST)
+
+
+def test_batch_reply_is_split_by_marker() -> None:
+    requests = [TranslationRequest(chapter_context="", text=t) for t in ("One.", "Two.")]
+    payload = {"message": {"content": "[[1]] Uno.\n[[2]] Due."}}
+    with patch("requests.Session.post", return_value=_mock_response(200, payload)) as post:
+        results = _translator().translate_batch(requests)
+    assert [r.translated_text for r in results] == ["Uno.", "Due."]
+    user_prompt = post.call_args.kwargs["json"]["messages"][1]["content"]
+    assert "[[1]] One.\n[[2]] Two." in user_prompt
+
+
+def test_batch_reply_with_missing_marker_raises_retryable() -> None:
+    requests = [TranslationRequest(chapter_context="", text=t) for t in ("One.", "Two.")]
+    payload = {"message": {"content": "[[1]] Uno. Due."}}
+    with patch("requests.Session.post", return_value=_mock_response(200, payload)):  # noqa: SIM117
+        with pytest.raises(RetryableTranslationError, match="1 of 2"):
+            _translator().translate_batch(requests)
+
+
+def test_batch_reply_with_rejected_paragraph_raises_partial_error() -> None:
+    requests = [TranslationRequest(chapter_context="", text=t) for t in ("One.", "Two.")]
+    payload = {"message": {"content": "[[1]] Uno.\n[[2]] <b>Due.</b>"}}
+    with patch("requests.Session.post", return_value=_mock_response(200, payload)):  # noqa: SIM117
+        with pytest.raises(PartialBatchTranslationError, match="HTML tag injection") as info:
+            _translator().translate_batch(requests)
+    assert info.value.translations == ["Uno.", None]
+
+
+def test_http_429_is_retryable_and_carries_retry_after() -> None:
+    resp = _mock_response(429)
+    resp.headers = {"Retry-After": "7"}
+    with patch("requests.Session.post", return_value=resp):  # noqa: SIM117
+        with pytest.raises(RetryableTranslationError, match="rate limit") as info:
+            _translator().translate(_REQUEST)
+    assert info.value.retry_after == 7.0
+
+
+def test_http_503_accepts_http_date_retry_after() -> None:
+    resp = _mock_response(503)
+    resp.headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}
+    with patch("requests.Session.post", return_value=resp):  # noqa: SIM117
+        with pytest.raises(RetryableTranslationError) as info:
+            _translator().translate(_REQUEST)
+    assert info.value.retry_after == 0.0
+
+
+def test_requests_reuse_one_pooled_session() -> None:
+    session = MagicMock()
+    session.post.return_value = _mock_response(200, {"message": {"content": "Ciao."}})
+    translator = OllamaTranslator(
+        settings=_SETTINGS, prompt_builder=PromptBuilder(), session=session
+    )
+
+    translator.translate(_REQUEST)
+    translator.translate(_REQUEST)
+
+    assert session.post.call_count == 2
+    assert session.post.call_args.args == ("http://localhost:11434/api/chat",)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from epub_translate_cli.infrastructure.epub.opf_spine_parser import OPFSpineParser
+
+_CONTAINER = b"""<?xml version='1.0'?>
+<container xmlns='urn:oasis:names:tc:opendocument:xmlns:container' version='1.0'>
+  <rootfiles><rootfile full-path='OEBPS/content.opf' media-type='application/oebps-package+xml'/>
+  </rootfiles>
+</container>"""
+
+_OPF = b"""<?xml version='1.0'?>
+<package xmlns='http://www.idpf.org/2007/opf' version='3.0'>
+  <manifest>
+    <item id='c2' href='text/ch2.xhtml' media-type='application/xhtml+xml'/>
+    <item id='c1' href='text/ch1.xhtml' media-type='application/xhtml+xml'/>
+    <item id='css' href='style.css' media-type='text/css'/>
+  </manifest>
+  <spine><itemref idref='c1'/><itemref idref='missing'/><itemref idref='c2'/></spine>
+</package>"""
+
+
+def test_find_opf_path_reads_namespaced_rootfile() -> None:
+    assert OPFSpineParser.find_opf_path({"META-INF/container.xml": _CONTAINER}) == (
+        "OEBPS/content.opf"
+    )
+
+
+def test_spine_order_resolves_manifest_hrefs() -> None:
+    paths = {"OEBPS/text/ch1.xhtml", "OEBPS/text/ch2.xhtml", "OEBPS/style.css"}
+
+    ordered = OPFSpineParser.ordered_chapter_paths(_OPF, paths, "OEBPS/content.opf")
+
+    assert ordered == ["OEBPS/text/ch1.xhtml", "OEBPS/text/ch2.xhtml"]
+
+
+def test_spine_order_accepts_opf_without_namespace() -> None:
+    opf = _OPF.replace(b" xmlns='http://www.idpf.org/2007/opf'", b"")
+
+    ordered = OPFSpineParser.ordered_chapter_paths(opf, {"text/ch1.xhtml"}, "content.opf")
+
+    assert ordered == ["text/ch1.xhtml"]
@@ -35,6 +35,9 @@ class FakeRepo(EpubRepositoryPort):
     def save(self, book: EpubBook, output_path: Path) -> None:
         raise AssertionError("save() must not be called when abort-on-error triggers")
 
+    def close(self, book: EpubBook) -> None:
+        pass
+
 
 @dataclass(frozen=True)
 class AlwaysFailTranslator(TranslatorPort):
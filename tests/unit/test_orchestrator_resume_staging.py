@@ -9,6 +9,7 @@ from epub_translate_cli.domain.errors import RetryableTranslationError
 from epub_translate_cli.domain.models import (
     ChapterDocument,
     EpubBook,
+    ItemOverlay,
     RunReport,
     TranslationRequest,
     TranslationResponse,
@@ -29,6 +30,7 @@ from epub_translate_cli.infrastructure.reporting.chapter_stage_store import (
 class RecordingRepo(EpubRepositoryPort):
     book: EpubBook
     saves: list[EpubBook] = field(default_factory=list)
+    closes: list[EpubBook] = field(default_factory=list)
 
     def load(self, input_path: Path) -> EpubBook:
         return self.book
@@ -36,6 +38,9 @@ class RecordingRepo(EpubRepositoryPort):
     def save(self, book: EpubBook, output_path: Path) -> None:
         self.saves.append(book)
 
+    def close(self, book: EpubBook) -> None:
+        self.closes.append(book)
+
 
 @dataclass
 class FlakyChapterTranslator(TranslatorPort):
@@ -154,6 +159,7 @@ def test_resume_retries_failed_chapters_when_input_equals_output(tmp_path: Path)
     assert translator.seen_texts.count("First chapter.") == 1
     assert translator.seen_texts.count("Second chapter.") == 1
     assert repo.saves == []
+    assert repo.closes == [book]
 
     stage_dir = FilesystemChapterStageStore.workspace_path(report_path)
     assert stage_dir.exists()
@@ -178,6 +184,7 @@ def test_resume_retries_failed_chapters_when_input_equals_output(tmp_path: Path)
     assert translator.seen_texts.count("First chapter.") == 1
     assert translator.seen_texts.count("Second chapter.") == 2
     assert len(repo.saves) == 1
+    assert repo.closes == [book, book]
 
     saved = repo.saves[0]
     assert b"Primo capitolo." in saved.items["OEBPS/ch1.xhtml"]
@@ -240,3 +247,29 @@ def test_reset_resume_state_forces_full_retranslation(tmp_path: Path) -> None:
     assert translator.seen_texts.count("Second chapter.") == 2
     assert len(repo.saves) == 1
     assert stage_dir.exists() is False
+
+
+def test_untranslated_chapters_stay_out_of_overlay(tmp_path: Path) -> None:
+    book, _, chapter_2 = _make_book()
+    repo = RecordingRepo(book=book)
+    settings = _settings(abort_on_error=False)
+    orchestrator = _build_orchestrator(
+        repo=repo,
+        translator=FlakyChapterTranslator(),
+        writer=SinkReportWriter(),
+        input_output_path=tmp_path / "book.epub",
+        report_path=tmp_path / "book.report.json",
+        settings=settings,
+    )
+
+    orchestrator.translate_epub(
+        input_path=tmp_path / "book.epub",
+        output_path=tmp_path / "book.epub",
+        report_path=tmp_path / "book.report.json",
+        settings=settings,
+    )
+
+    saved = repo.saves[0].items
+    assert isinstance(saved, ItemOverlay)
+    assert list(saved.overrides) == ["OEBPS/ch1.xhtml"]
+    assert saved["OEBPS/ch2.xhtml"] is chapter_2
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+
+from epub_translate_cli.application.services.chapter_translator import ChapterTranslator
+from epub_translate_cli.domain.errors import (
+    PartialBatchTranslationError,
+    RetryableTranslationError,
+)
+from epub_translate_cli.domain.models import (
+    ChapterDocument,
+    TranslationRequest,
+    TranslationResponse,
+)
+from epub_translate_cli.domain.ports import BatchTranslatorPort
+from epub_translate_cli.infrastructure.epub.xhtml_parser import XHTMLTranslator
+from tests.conftest import make_settings
+
+_CHAPTER = b"""<?xml version='1.0' encoding='utf-8'?>
+<html xmlns='http://www.w3.org/1999/xhtml'>
+  <body><p>one</p><p>two</p><p>three</p></body>
+</html>"""
+
+_SETTINGS = make_settings(paragraph_batch_size=2)
+
+
+@dataclass
+class RecordingBatchTranslator(BatchTranslatorPort):
+    fail_batches: bool = False
+    reject_text: str | None = None
+    batches: list[list[str]] = field(default_factory=list)
+    singles: list[str] = field(default_factory=list)
+
+    def translate(self, request: TranslationRequest) -> TranslationResponse:
+        self.singles.append(request.text)
+        return TranslationResponse(translated_text=request.text.upper())
+
+    def translate_batch(self, requests: Sequence[TranslationRequest]) -> list[TranslationResponse]:
+        self.batches.append([r.text for r in requests])
+        if self.fail_batches:
+            raise RetryableTranslationError("misaligned")
+        if any(r.text == self.reject_text for r in requests):
+            translations: list[str | None] = [
+                None if r.text == self.reject_text else r.text.upper() for r in requests
+            ]
+            raise PartialBatchTranslationError("rejected", translations=translations)
+        return [TranslationResponse(translated_text=r.text.upper()) for r in requests]
+
+
+def _translate(translator: RecordingBatchTranslator) -> list[str]:
+    processor = ChapterTranslator(
+        translator=translator, settings=_SETTINGS, xhtml_parser=XHTMLTranslator()
+    )
+    _, result = processor.translate_chapter(
+        ChapterDocument(path="OEBPS/ch1.xhtml", xhtml_bytes=_CHAPTER)
+    )
+    return [c.after for c in result.changes]
+
+
+def test_paragraphs_are_grouped_into_batches() -> None:
+    translator = RecordingBatchTranslator()
+
+    assert _translate(translator) == ["ONE", "TWO", "THREE"]
+    assert translator.batches == [["one", "two"]]
+    assert translator.singles == ["three"]
+
+
+def test_failed_batch_falls_back_to_single_requests() -> None:
+    translator = RecordingBatchTranslator(fail_batches=True)
+
+    assert _translate(translator) == ["ONE", "TWO", "THREE"]
+    assert translator.singles == ["one", "two", "three"]
+
+
+def test_rejected_paragraph_of_aligned_batch_is_retried_alone() -> None:
+    translator = RecordingBatchTranslator(reject_text="two")
+
+    assert _translate(translator) == ["ONE", "TWO", "THREE"]
+    assert translator.singles == ["two", "three"]
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass, field, replace
+
+from epub_translate_cli.application.services.chapter_translator import ChapterTranslator
+from epub_translate_cli.domain.models import (
+    ChapterDocument,
+    TranslationRequest,
+    TranslationResponse,
+    TranslationSettings,
+)
+from epub_translate_cli.domain.ports import TranslatorPort
+from epub_translate_cli.infrastructure.epub.xhtml_parser import XHTMLTranslator
+from tests.conftest import make_settings
+
+_CHAPTER = b"""<?xml version='1.0' encoding='utf-8'?>
+<html xmlns='http://www.w3.org/1999/xhtml'>
+  <body><p>one</p><p>two</p><p>three</p><p>four</p></body>
+</html>"""
+
+
+@dataclass(frozen=True)
+class OverlapTranslator(TranslatorPort):
+    """Upper-cases text and records how many requests were in flight at once."""
+
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    state: dict[str, int] = field(default_factory=lambda: {"active": 0, "peak": 0})
+    barrier: threading.Barrier = field(default_factory=lambda: threading.Barrier(2, timeout=5))
+
+    def translate(self, request: TranslationRequest) -> TranslationResponse:
+        with self.lock:
+            self.state["active"] += 1
+            self.state["peak"] = max(self.state["peak"], self.state["active"])
+        if request.text in {"one", "two"}:
+            self.barrier.wait()
+        with self.lock:
+            self.state["active"] -= 1
+        return TranslationResponse(translated_text=request.text.upper())
+
+
+def _settings(paragraph_lookahead: int) -> TranslationSettings:
+    return make_settings(paragraph_lookahead=paragraph_lookahead)
+
+
+def test_lookahead_overlaps_requests_and_keeps_document_order() -> None:
+    translator = OverlapTranslator()
+    processor = ChapterTranslator(
+        translator=translator,
+        settings=_settings(paragraph_lookahead=1),
+        xhtml_parser=XHTMLTranslator(),
+    )
+
+    updated, result = processor.translate_chapter(
+        ChapterDocument(path="OEBPS/ch1.xhtml", xhtml_bytes=_CHAPTER)
+    )
+
+    assert translator.state["peak"] == 2
+    assert [c.after for c in result.changes] == ["ONE", "TWO", "THREE", "FOUR"]
+    assert b"<p>ONE</p><p>TWO</p><p>THREE</p><p>FOUR</p>" in updated
+    assert b"data-translation-pending" not in updated
+
+
+def test_context_free_fan_out_reports_skips_in_document_order() -> None:
+    chapter = _CHAPTER.replace(b"<p>two</p>", b"<p><code>x()</code></p><p>two</p><p> </p>")
+    translator = OverlapTranslator()
+    processor = ChapterTranslator(
+        translator=translator,
+        settings=replace(_settings(paragraph_lookahead=3), context_paragraphs=0),
+        xhtml_parser=XHTMLTranslator(),
+    )
+
+    _, result = processor.translate_chapter(
+        ChapterDocument(path="OEBPS/ch1.xhtml", xhtml_bytes=chapter)
+    )
+
+    assert [c.after for c in result.changes] == ["ONE", "TWO", "THREE", "FOUR"]
+    assert [s.reason for s in result.skips] == ["protected_code", "empty"]
+
+
+def test_chapter_without_changes_returns_source_bytes() -> None:
+    chapter = _CHAPTER.replace(b"<p>one</p><p>two</p><p>three</p><p>four</p>", b"<p> </p>")
+    processor = ChapterTranslator(
+        translator=OverlapTranslator(),
+        settings=_settings(paragraph_lookahead=0),
+        xhtml_parser=XHTMLTranslator(),
+    )
+
+    updated, result = processor.translate_chapter(
+        ChapterDocument(path="OEBPS/ch1.xhtml", xhtml_bytes=chapter)
+    )
+
+    assert updated is chapter
+    assert not result.changes
+    assert [s.reason for s in result.skips] == ["empty"]
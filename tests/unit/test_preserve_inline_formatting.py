@@ -287,3 +287,21 @@ def test_translates_heading_tags_not_only_paragraphs() -> None:
 
     heading = _xpath_first(root, "//*[local-name()='h1']")
     assert _itertext_str(heading) == "I PAESI BASSI"
+
+
+def test_nearest_word_boundary_handles_text_without_spaces() -> None:
+    text = "这是没有空格的段落" * 10
+    assert nearest_word_boundary(text, 60) == len(text)
+    assert nearest_word_boundary(text, 30) == 1
+    assert nearest_word_boundary("ab cd", 3) == 3
+
+
+def test_distribute_text_many_slots_cut_on_word_boundaries() -> None:
+    translated = "uno due tre quattro cinque sei sette otto"
+    chunks = distribute_text(translated, [4, 4, 4, 8, 7, 4, 6, 5])
+
+    assert "".join(chunks) == translated
+    cut = 0
+    for chunk in chunks[:-1]:
+        cut += len(chunk)
+        assert translated[cut - 1] == " " or translated[cut] == " "
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from collections import deque
+
+from epub_translate_cli.infrastructure.epub.xhtml_parser import _format_prior_pairs
+
+
+def _window() -> deque[tuple[str, str]]:
+    return deque([("one " * 40, "uno " * 40), ("two", "due"), ("three", "tre")], maxlen=3)
+
+
+def test_no_budget_keeps_whole_window() -> None:
+    formatted = _format_prior_pairs(_window(), 3)
+    assert formatted.count("Original:") == 3
+
+
+def test_budget_drops_oldest_pairs_first() -> None:
+    formatted = _format_prior_pairs(_window(), 3, token_budget=20)
+    assert formatted == "Original: two\nTranslation: due\n\nOriginal: three\nTranslation: tre"
+
+
+def test_disabled_context_returns_empty() -> None:
+    assert _format_prior_pairs(_window(), 0, token_budget=256) == ""
+
+
+def test_oversized_newest_pair_keeps_its_trailing_sentences() -> None:
+    source = " ".join(f"Source sentence number {i} runs on for a while." for i in range(12))
+    translation = " ".join(f"Frase tradotta numero {i} che continua un po'." for i in range(12))
+    window = deque([("older " * 100, "vecchio " * 100), (source, translation)], maxlen=3)
+
+    formatted = _format_prior_pairs(window, 3, token_budget=64)
+
+    assert formatted.startswith("Original: Source sentence number")
+    assert formatted.endswith("Frase tradotta numero 11 che continua un po'.")
+    assert "older" not in formatted
+    assert 0 < len(formatted.encode("utf-8")) // 4 <= 64
+
+
+def test_single_oversized_sentence_is_still_kept() -> None:
+    window = deque([("word " * 400, "parola " * 400)], maxlen=3)
+
+    formatted = _format_prior_pairs(window, 3, token_budget=16)
+
+    assert formatted.startswith("Original: word")
+    assert "Translation: parola" in formatted
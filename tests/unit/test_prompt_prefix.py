@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+import os
+
+from epub_translate_cli.domain.models import TranslationRequest
+from epub_translate_cli.infrastructure.llm.prompt_builder import (
+    GlossaryAwarePromptBuilder,
+    PromptBuilder,
+)
+from tests.conftest import make_settings
+
+_SETTINGS = make_settings()
+
+
+def test_system_prompt_is_reused_verbatim() -> None:
+    builder = PromptBuilder()
+    assert builder.build_system_prompt(_SETTINGS) is builder.build_system_prompt(_SETTINGS)
+
+
+def test_requests_of_one_chapter_share_context_prefix() -> None:
+    builder = GlossaryAwarePromptBuilder()
+    first = TranslationRequest(
+        chapter_context="A storm.", text="It rained.", glossary_terms={"storm": "tempesta"}
+    )
+    second = TranslationRequest(
+        chapter_context="A storm.",
+        text="It stopped.",
+        prior_translations="Original: It rained.\nTranslation: Pioveva.",
+        glossary_terms={"storm": "tempesta"},
+    )
+
+    prompts = [builder.build_user_prompt(first), builder.build_user_prompt(second)]
+    shared = os.path.commonprefix(prompts)
+
+    assert shared.startswith("MANDATORY TERM TRANSLATIONS")
+    assert shared.endswith("A storm.\n>>>\n\n")
+
+
+def test_context_block_is_formatted_once_per_chapter_context() -> None:
+    builder = PromptBuilder()
+    context = "".join(["A long chapter context. "] * 20)
+
+    first = builder._context_block(context)
+
+    assert builder._context_block(context) is first
+    assert builder.build_user_prompt(
+        TranslationRequest(chapter_context=context, text="x")
+    ).startswith(first)
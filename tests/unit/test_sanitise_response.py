@@ -21,6 +21,10 @@ class TestSanitiseResponse:
         result = _sanitise_response("'Ciao mondo'", "Hello world")
         assert result == "Ciao mondo"
 
+    def test_keeps_mismatched_quotes(self) -> None:
+        result = _sanitise_response("\"Ciao mondo'", "Hello world")
+        assert result == "\"Ciao mondo'"
+
     def test_strips_leaked_text_to_translate_marker(self) -> None:
         raw = (
             "CHAPTER CONTEXT (for tone/terminology):\n"
@@ -71,3 +75,13 @@ class TestSanitiseResponse:
         raw = "<<<\nOriginal source text\n>>>\nCiao mondo tradotto."
         result = _sanitise_response(raw, "Original source text")
         assert result == "Ciao mondo tradotto."
+
+    def test_strips_last_lowercase_marker(self) -> None:
+        raw = "Chapter context: the war.\ntext to translate :  Capitolo 1"
+        result = _sanitise_response(raw, "Chapter 1 of the book")
+        assert result == "Capitolo 1"
+
+    def test_strips_marker_when_uppercasing_changes_length(self) -> None:
+        raw = "TEXT TO TRANSLATE:\nStraße"
+        result = _sanitise_response(raw, "Street name here")
+        assert result == "Straße"
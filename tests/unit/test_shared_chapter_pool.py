@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+import threading
+
+from epub_translate_cli.application.services.shared_pools import shared_pool
+
+
+def test_pool_is_reused_by_name() -> None:
+    assert shared_pool("chapter") is shared_pool("chapter")
+    assert shared_pool("paragraph") is not shared_pool("chapter")
+
+
+def test_pool_keeps_serving_concurrent_runs() -> None:
+    barrier = threading.Barrier(2, timeout=5)
+    first = shared_pool("chapter").submit(barrier.wait)
+
+    second = shared_pool("chapter").submit(barrier.wait)
+
+    assert {first.result(), second.result()} == {0, 1}
+    assert shared_pool("chapter").submit(lambda: 42).result() == 42
@@ -2,7 +2,8 @@ from __future__ import annotations
 
 from lxml import etree
 
-from epub_translate_cli.infrastructure.epub.xhtml_parser import _skip_reason
+from epub_translate_cli.domain.models import SkipReason
+from epub_translate_cli.infrastructure.epub.xhtml_parser import _skip_reason, skip_reasons
 
 
 def _parse(xml: str) -> etree._Element:
@@ -109,3 +110,85 @@ def test_no_skip_for_heading() -> None:
     )
     heading = _first(root, "//*[local-name()='h2']")
     assert _skip_reason(heading) is None
+
+
+def test_skips_uppercase_code_without_namespace() -> None:
+    root = _parse("<html><body><PRE><p>Do not translate</p></PRE></body></html>")
+    p = _first(root, "//p")
+    assert _skip_reason(p) == "protected_code"
+
+
+def test_skips_paragraph_containing_script() -> None:
+    root = _parse(
+        """<html xmlns='http://www.w3.org/1999/xhtml'>
+          <body><p>Text <script>var x;</script></p></body>
+        </html>"""
+    )
+    p = _first(root, "//*[local-name()='p']")
+    assert _skip_reason(p) == "protected_metadata"
+
+
+def test_ancestor_cache_reuses_shared_ancestry() -> None:
+    root = _parse(
+        """<html xmlns='http://www.w3.org/1999/xhtml'>
+          <body>
+            <div><p>One</p><p>Two</p></div>
+            <pre><p>Code</p></pre>
+          </body>
+        </html>"""
+    )
+    paragraphs = [e for e in root.iter() if etree.QName(e).localname == "p"]
+    cache: dict[etree._Element, SkipReason | None] = {}
+
+    reasons = [_skip_reason(p, cache) for p in paragraphs]
+
+    assert reasons == [None, None, "protected_code"]
+    assert cache[root] is None
+    assert cache[paragraphs[2]] == "protected_code"
+    assert [_skip_reason(p) for p in paragraphs] == reasons
+
+
+def test_chapter_pass_matches_per_element_classification() -> None:
+    root = _parse(
+        """<html xmlns='http://www.w3.org/1999/xhtml'>
+          <head><title>T</title></head>
+          <body>
+            <p>Plain</p>
+            <div><p>Run <code>x()</code> then <script>y</script></p><p>After</p></div>
+            <pre><p>Code</p></pre>
+          </body>
+        </html>"""
+    )
+    elements = list(root.iter())
+
+    assert skip_reasons(root, elements) == [_skip_reason(e) for e in elements]
+
+
+def test_skips_protected_tags_in_foreign_namespaces() -> None:
+    """Inline SVG `script`/`title` and uppercase tags are protected like their XHTML twins."""
+    root = _parse(
+        """<?xml version='1.0' encoding='utf-8'?>
+        <html xmlns='http://www.w3.org/1999/xhtml'>
+          <body>
+            <p id='scripted'>Caption
+              <svg xmlns='http://www.w3.org/2000/svg'><script>draw()</script></svg>
+            </p>
+            <svg xmlns='http://www.w3.org/2000/svg'>
+              <title><p xmlns='http://www.w3.org/1999/xhtml' id='titled'>Chart</p></title>
+            </svg>
+            <div><PRE><p id='shouted'>x = 1</p></PRE></div>
+            <p id='plain'>Translate me</p>
+          </body>
+        </html>"""
+    )
+    ids = ("scripted", "titled", "shouted", "plain")
+    paragraphs = [_first(root, f"//*[@id='{pid}']") for pid in ids]
+    expected: list[SkipReason | None] = [
+        "protected_metadata",
+        "protected_metadata",
+        "protected_code",
+        None,
+    ]
+
+    assert [_skip_reason(p) for p in paragraphs] == expected
+    assert skip_reasons(root, paragraphs) == expected
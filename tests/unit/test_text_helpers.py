@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from epub_translate_cli.infrastructure.epub.xhtml_parser import (
+    BACKOFF_CAP_SECONDS,
+    RETRY_AFTER_CAP_SECONDS,
+    _backoff_seconds,
+    _limit,
+    strip_fences,
+)
+
+
+def test_limit_collapses_unicode_whitespace_runs() -> None:
+    assert _limit("  a\n\t b  c  ", 20) == "a b c"
+
+
+def test_limit_truncates_with_ellipsis() -> None:
+    assert _limit("abcdef", 4) == "abc…"
+
+
+def test_strip_fences_removes_echoed_markers() -> None:
+    assert strip_fences("<<< Ciao >>>") == "Ciao"
+    assert strip_fences("  Ciao  ") == "Ciao"
+
+
+def test_backoff_is_jittered_below_the_exponential_cap() -> None:
+    delays = [_backoff_seconds(10) for _ in range(50)]
+    assert all(0.0 <= delay <= BACKOFF_CAP_SECONDS for delay in delays)
+    assert len(set(delays)) > 1
+
+
+def test_backoff_honours_capped_provider_hint() -> None:
+    assert _backoff_seconds(0, 2.5) == 2.5
+    assert _backoff_seconds(0, 3600.0) == RETRY_AFTER_CAP_SECONDS
+
+
+def test_limit_truncates_long_text_from_its_opening_words() -> None:
+    text = "  word\n" * 10_000
+    assert _limit(text, 12) == "word word w…"
+    assert _limit("a" + " " * 50, 4) == "a"
+
+
+def test_strip_fences_handles_padding_and_single_markers() -> None:
+    assert strip_fences("\n <<<\nCiao\n>>>\n") == "Ciao"
+    assert strip_fences("<<< Ciao") == "Ciao"
+    assert strip_fences("Ciao >>>") == "Ciao"
+    assert strip_fences("a >>> b") == "a >>> b"